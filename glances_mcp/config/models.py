@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
@@ -141,6 +142,11 @@ class Alert(BaseModel):
     resolved_timestamp: datetime | None = None
     tags: dict[str, str] = Field(default_factory=dict)
 
+    @cached_property
+    def timestamp_epoch(self) -> float:
+        """Trigger time as epoch seconds, converted once per alert."""
+        return self.timestamp.timestamp()
+
 
 class PerformanceBaseline(BaseModel):
     """Performance baseline data."""
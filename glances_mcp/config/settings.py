@@ -31,6 +31,9 @@ class Settings(BaseSettings):
     baseline_retention_days: int = 7
     alert_history_retention_days: int = 30
     max_concurrent_requests: int = 100
+    # Deadline for all of one server's requests in a tool call, as a multiple of
+    # that server's per-request timeout; a fetch may chain several requests
+    server_fetch_timeout_factor: float = 3.0
 
     # Logging configuration
     log_level: str = "INFO"
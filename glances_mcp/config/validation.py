@@ -1,5 +1,6 @@
 """Input validation utilities for Glances MCP server."""
 
+from collections.abc import Callable
 import re
 from typing import Any
 
@@ -7,6 +8,12 @@ from pydantic import BaseModel, ValidationError
 
 from .models import AlertThreshold, GlancesServer
 
+_SERVER_ALIAS_PATTERN = re.compile(r"^[a-zA-Z0-9\-_\s]+$")
+_HOST_PATTERN = re.compile(r"^[a-zA-Z0-9\.\-]+$")
+_METRIC_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9\.\-_]+$")
+
+_SORT_BY_CHOICES = frozenset({"cpu", "memory", "name", "pid"})
+
 
 class ServerValidationMixin:
     """Validation methods for server configurations."""
@@ -21,7 +28,7 @@ class ServerValidationMixin:
             raise ValueError("Server alias must be 64 characters or less")
 
         # Allow alphanumeric, dashes, underscores, and spaces
-        if not re.match(r"^[a-zA-Z0-9\-_\s]+$", alias):
+        if not _SERVER_ALIAS_PATTERN.match(alias):
             raise ValueError("Server alias can only contain alphanumeric characters, dashes, underscores, and spaces")
 
         return alias.strip()
@@ -33,7 +40,7 @@ class ServerValidationMixin:
             raise ValueError("Host cannot be empty")
 
         # Basic validation - more comprehensive validation could use ipaddress module
-        if not re.match(r"^[a-zA-Z0-9\.\-]+$", host):
+        if not _HOST_PATTERN.match(host):
             raise ValueError("Invalid host format")
 
         return host.strip()
@@ -60,7 +67,7 @@ class MetricValidationMixin:
             raise ValueError("Metric name cannot be empty")
 
         # Allow alphanumeric, dots, dashes, underscores
-        if not re.match(r"^[a-zA-Z0-9\.\-_]+$", metric):
+        if not _METRIC_NAME_PATTERN.match(metric):
             raise ValueError("Metric name can only contain alphanumeric characters, dots, dashes, and underscores")
 
         return metric.strip()
@@ -139,17 +146,14 @@ class InputValidator(BaseModel, ServerValidationMixin, MetricValidationMixin):
 
         if "sort_by" in params:
             sort_by = params.get("sort_by", "cpu")
-            if sort_by not in ["cpu", "memory", "name", "pid"]:
+            if sort_by not in _SORT_BY_CHOICES:
                 raise ValueError("sort_by must be one of: cpu, memory, name, pid")
             validated_params["sort_by"] = sort_by
 
         # Tool-specific validation
-        if tool_name == "get_top_processes":
-            validated_params.update(cls._validate_process_params(params))
-        elif tool_name == "get_containers":
-            validated_params.update(cls._validate_container_params(params))
-        elif tool_name == "check_alert_conditions":
-            validated_params.update(cls._validate_alert_params(params))
+        tool_validator = _TOOL_PARAM_VALIDATORS.get(tool_name)
+        if tool_validator is not None:
+            validated_params.update(tool_validator(params))
 
         return validated_params
 
@@ -166,19 +170,6 @@ class InputValidator(BaseModel, ServerValidationMixin, MetricValidationMixin):
 
         return validated
 
-    @classmethod
-    def _validate_container_params(cls, params: dict[str, Any]) -> dict[str, Any]:
-        """Validate container-related parameters."""
-        validated = {}
-
-        if "include_stopped" in params:
-            include_stopped = params.get("include_stopped", False)
-            if not isinstance(include_stopped, bool):
-                raise ValueError("include_stopped must be a boolean")
-            validated["include_stopped"] = include_stopped
-
-        return validated
-
     @classmethod
     def _validate_alert_params(cls, params: dict[str, Any]) -> dict[str, Any]:
         """Validate alert-related parameters."""
@@ -191,3 +182,10 @@ class InputValidator(BaseModel, ServerValidationMixin, MetricValidationMixin):
             validated["severity"] = severity
 
         return validated
+
+
+# Tool-specific parameter validators, resolved once instead of per call
+_TOOL_PARAM_VALIDATORS: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "get_top_processes": InputValidator._validate_process_params,
+    "check_alert_conditions": InputValidator._validate_alert_params,
+}
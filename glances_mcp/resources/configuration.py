@@ -1,12 +1,12 @@
 """Configuration resources for Glances MCP server."""
 
-import json
 from typing import Any, cast
 
 from fastmcp import FastMCP
 
 from glances_mcp.config.settings import settings
 from glances_mcp.services.glances_client import GlancesClientPool
+from glances_mcp.utils.helpers import to_json
 
 
 def register_configuration_resources(app: FastMCP, client_pool: GlancesClientPool) -> None:
@@ -117,7 +117,7 @@ def register_configuration_resources(app: FastMCP, client_pool: GlancesClientPoo
                 }
             }
 
-            return json.dumps(config_resource, indent=2)
+            return to_json(config_resource)
 
         except Exception as e:
             error_response = {
@@ -129,7 +129,7 @@ def register_configuration_resources(app: FastMCP, client_pool: GlancesClientPoo
                 "servers": [],
                 "message": "Unable to load server configuration"
             }
-            return json.dumps(error_response, indent=2)
+            return to_json(error_response)
 
     @app.resource("glances://config/thresholds")
     async def thresholds_config() -> str:
@@ -239,7 +239,7 @@ def register_configuration_resources(app: FastMCP, client_pool: GlancesClientPoo
                 }
             }
 
-            return json.dumps(thresholds_resource, indent=2)
+            return to_json(thresholds_resource)
 
         except Exception as e:
             error_response = {
@@ -252,7 +252,7 @@ def register_configuration_resources(app: FastMCP, client_pool: GlancesClientPoo
                 "alert_rules": [],
                 "message": "Unable to load threshold configuration"
             }
-            return json.dumps(error_response, indent=2)
+            return to_json(error_response)
 
     @app.resource("glances://config/maintenance_windows")
     async def maintenance_windows_config() -> str:
@@ -358,7 +358,7 @@ def register_configuration_resources(app: FastMCP, client_pool: GlancesClientPoo
                 }
             }
 
-            return json.dumps(maintenance_resource, indent=2)
+            return to_json(maintenance_resource)
 
         except Exception as e:
             error_response = {
@@ -370,7 +370,7 @@ def register_configuration_resources(app: FastMCP, client_pool: GlancesClientPoo
                 "maintenance_windows": [],
                 "message": "Unable to load maintenance window configuration"
             }
-            return json.dumps(error_response, indent=2)
+            return to_json(error_response)
 
     @app.resource("glances://config/settings")
     async def application_settings() -> str:
@@ -392,6 +392,7 @@ def register_configuration_resources(app: FastMCP, client_pool: GlancesClientPoo
                 },
                 "performance": {
                     "max_concurrent_requests": settings.max_concurrent_requests,
+                    "server_fetch_timeout_factor": settings.server_fetch_timeout_factor,
                     "baseline_retention_days": settings.baseline_retention_days,
                     "alert_history_retention_days": settings.alert_history_retention_days
                 },
@@ -480,7 +481,8 @@ def register_configuration_resources(app: FastMCP, client_pool: GlancesClientPoo
                     "GLANCES_MCP_LOG_FORMAT": "Log format (json, text)",
                     "GLANCES_MCP_CONFIG_FILE": "Path to configuration file",
                     "GLANCES_MCP_GLANCES_TIMEOUT": "Glances API timeout in seconds",
-                    "GLANCES_MCP_MAX_CONCURRENT_REQUESTS": "Maximum concurrent requests"
+                    "GLANCES_MCP_MAX_CONCURRENT_REQUESTS": "Maximum concurrent requests",
+                    "GLANCES_MCP_SERVER_FETCH_TIMEOUT_FACTOR": "Per-server deadline for a tool call, as a multiple of the server's request timeout"
                 },
                 "configuration_validation": {
                     "server_ports": "Must be between 1 and 65535",
@@ -491,7 +493,7 @@ def register_configuration_resources(app: FastMCP, client_pool: GlancesClientPoo
                 }
             }
 
-            return json.dumps(settings_resource, indent=2)
+            return to_json(settings_resource)
 
         except Exception as e:
             error_response = {
@@ -503,4 +505,4 @@ def register_configuration_resources(app: FastMCP, client_pool: GlancesClientPoo
                 "current_settings": {},
                 "message": "Unable to load application settings"
             }
-            return json.dumps(error_response, indent=2)
+            return to_json(error_response)
@@ -1,13 +1,14 @@
 """Historical data resources for Glances MCP server."""
 
+from collections import Counter
 from datetime import datetime
-import json
 from typing import Any, cast
 
 from fastmcp import FastMCP
 
 from glances_mcp.services.alert_engine import AlertEngine
 from glances_mcp.services.baseline_manager import BaselineManager
+from glances_mcp.utils.helpers import to_json
 
 
 def register_historical_resources(
@@ -88,7 +89,7 @@ def register_historical_resources(
                 }
             }
 
-            return json.dumps(performance_resource, indent=2)
+            return to_json(performance_resource)
 
         except Exception as e:
             error_response = {
@@ -101,7 +102,7 @@ def register_historical_resources(
                 "performance_trends": {},
                 "message": "Unable to load performance history"
             }
-            return json.dumps(error_response, indent=2)
+            return to_json(error_response)
 
     @app.resource("glances://history/alerts")
     async def alerts_history() -> str:
@@ -182,13 +183,14 @@ def register_historical_resources(
 
             for rule, alerts in rule_counts.items():
                 if len(alerts) >= 3:  # 3 or more occurrences
+                    severity_counts = Counter(a.severity for a in alerts)
                     cast(list[dict[str, Any]], alert_insights["recurring_issues"]).append({
                         "rule_name": rule,
                         "occurrences": len(alerts),
                         "servers_affected": len({a.server_alias for a in alerts}),
                         "severity_distribution": {
-                            "critical": len([a for a in alerts if a.severity == "critical"]),
-                            "warning": len([a for a in alerts if a.severity == "warning"])
+                            "critical": severity_counts["critical"],
+                            "warning": severity_counts["warning"]
                         }
                     })
 
@@ -231,7 +233,7 @@ def register_historical_resources(
                 }
             }
 
-            return json.dumps(alert_history_resource, indent=2)
+            return to_json(alert_history_resource)
 
         except Exception as e:
             error_response = {
@@ -244,7 +246,7 @@ def register_historical_resources(
                 "historical_analysis": {},
                 "message": "Unable to load alert history"
             }
-            return json.dumps(error_response, indent=2)
+            return to_json(error_response)
 
     @app.resource("glances://history/capacity")
     async def capacity_history() -> str:
@@ -368,7 +370,7 @@ def register_historical_resources(
                 }
             }
 
-            return json.dumps(capacity_history_resource, indent=2)
+            return to_json(capacity_history_resource)
 
         except Exception as e:
             error_response = {
@@ -381,4 +383,4 @@ def register_historical_resources(
                 "fleet_insights": {},
                 "message": "Unable to load capacity history"
             }
-            return json.dumps(error_response, indent=2)
+            return to_json(error_response)
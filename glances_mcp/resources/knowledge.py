@@ -1,10 +1,11 @@
 """Knowledge base resources for Glances MCP server."""
 
 from datetime import datetime
-import json
 
 from fastmcp import FastMCP
 
+from glances_mcp.utils.helpers import to_json
+
 
 def register_knowledge_resources(app: FastMCP) -> None:
     """Register knowledge base resources with the MCP server."""
@@ -223,7 +224,7 @@ def register_knowledge_resources(app: FastMCP) -> None:
             }
         }
 
-        return json.dumps(runbooks_resource, indent=2)
+        return to_json(runbooks_resource)
 
     @app.resource("glances://knowledge/baselines")
     async def performance_baselines_knowledge() -> str:
@@ -376,4 +377,4 @@ def register_knowledge_resources(app: FastMCP) -> None:
             }
         }
 
-        return json.dumps(baselines_resource, indent=2)
+        return to_json(baselines_resource)
@@ -1,7 +1,12 @@
 """Alert engine for Glances MCP server."""
 
 import asyncio
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from collections.abc import Iterator
 from datetime import datetime, timedelta
+import heapq
+from itertools import takewhile
 from typing import Any, Literal, cast
 
 from glances_mcp.config.models import (
@@ -13,7 +18,8 @@ from glances_mcp.config.models import (
 )
 from glances_mcp.services.glances_client import GlancesClientPool
 from glances_mcp.utils.helpers import (
-    is_within_maintenance_window,
+    compile_maintenance_windows,
+    is_within_compiled_maintenance_window,
     safe_get,
 )
 from glances_mcp.utils.logging import logger
@@ -26,8 +32,13 @@ class AlertEngine:
         self.client_pool = client_pool
         self.config = config
         self.active_alerts: dict[str, Alert] = {}
+        # Append-only and therefore ordered by trigger time, oldest first
         self.alert_history: list[Alert] = []
         self.alert_cooldowns: dict[str, datetime] = {}
+        # The configuration is fixed for the engine's lifetime, so parse the windows once
+        self._maintenance_windows = compile_maintenance_windows(
+            [window.model_dump() for window in config.maintenance_windows]
+        )
 
     def _generate_alert_id(self, server_alias: str, rule_name: str, metric_path: str) -> str:
         """Generate unique alert ID."""
@@ -35,13 +46,7 @@ class AlertEngine:
 
     def _should_suppress_alert(self, server: GlancesServer, rule: AlertRule) -> bool:
         """Check if alert should be suppressed due to maintenance windows."""
-        if not self.config.maintenance_windows:
-            return False
-
-        # Convert maintenance windows to dict format for helper function
-        maintenance_dicts = [window.model_dump() for window in self.config.maintenance_windows]
-
-        return is_within_maintenance_window(maintenance_dicts)
+        return is_within_compiled_maintenance_window(self._maintenance_windows)
 
     def _is_in_cooldown(self, alert_id: str, rule: AlertRule) -> bool:
         """Check if alert is in cooldown period."""
@@ -288,31 +293,73 @@ class AlertEngine:
         hours: int = 24,
         limit: int = 100
     ) -> list[Alert]:
-        """Get alert history."""
+        """Get alert history, newest first."""
+        alerts: list[Alert] = []
+
+        # Walking the chronological history backwards yields newest-first
+        # order without sorting and stops at the window or the limit
+        for alert in self._recent_history(hours):
+            if server_alias and alert.server_alias != server_alias:
+                continue
+            if severity and alert.severity != severity:
+                continue
+
+            alerts.append(alert)
+            if len(alerts) >= limit:
+                break
+
+        return alerts
+
+    def _recent_history(self, hours: int) -> Iterator[Alert]:
+        """Iterate history alerts within the time window, newest first."""
         cutoff_time = datetime.now() - timedelta(hours=hours)
+        return takewhile(lambda a: a.timestamp >= cutoff_time, reversed(self.alert_history))
 
-        alerts = [a for a in self.alert_history if a.timestamp >= cutoff_time]
+    def count_by_severity(self, hours: int = 24) -> dict[str, int]:
+        """Count historical alerts per severity within the time window."""
+        counts = Counter(alert.severity for alert in self._recent_history(hours))
 
-        if server_alias:
-            alerts = [a for a in alerts if a.server_alias == server_alias]
+        return {"critical": counts["critical"], "warning": counts["warning"]}
 
-        if severity:
-            alerts = [a for a in alerts if a.severity == severity]
+    def count_by_age_buckets(
+        self,
+        thresholds: tuple[float, ...] = (3600, 21600)
+    ) -> dict[str, list[int]]:
+        """Count active alerts per severity and age bucket, split at thresholds in seconds."""
+        now_ts = datetime.now().timestamp()
+        counts = {
+            "critical": [0] * (len(thresholds) + 1),
+            "warning": [0] * (len(thresholds) + 1)
+        }
+
+        for alert in self.active_alerts.values():
+            counts[alert.severity][bisect_right(thresholds, now_ts - alert.timestamp_epoch)] += 1
+
+        return counts
 
-        # Sort by timestamp descending and limit
-        alerts = sorted(alerts, key=lambda a: a.timestamp, reverse=True)
-        return alerts[:limit]
+    def group_counts(
+        self,
+        hours: int = 24,
+        by: Literal["server", "rule"] = "server"
+    ) -> dict[str, int]:
+        """Count historical alerts per server or rule within the time window."""
+        recent_alerts = self._recent_history(hours)
+
+        if by == "server":
+            return dict(Counter(a.server_alias for a in recent_alerts))
+        return dict(Counter(a.rule_name for a in recent_alerts))
 
     def get_alert_summary(self) -> dict[str, Any]:
         """Get alert summary statistics."""
         active_alerts = self.get_active_alerts()
+        severity_counts = Counter(a.severity for a in active_alerts)
 
         summary = {
             "total_active": len(active_alerts),
-            "critical_count": len([a for a in active_alerts if a.severity == "critical"]),
-            "warning_count": len([a for a in active_alerts if a.severity == "warning"]),
+            "critical_count": severity_counts["critical"],
+            "warning_count": severity_counts["warning"],
             "servers_with_alerts": len({a.server_alias for a in active_alerts}),
-            "recent_alerts_24h": len(self.get_alert_history(hours=24)),
+            "recent_alerts_24h": sum(self.count_by_severity(hours=24).values()),
             "top_alerting_servers": self._get_top_alerting_servers(),
             "most_common_alerts": self._get_most_common_alerts()
         }
@@ -321,19 +368,18 @@ class AlertEngine:
 
     def _get_top_alerting_servers(self, limit: int = 5) -> list[dict[str, Any]]:
         """Get servers with most active alerts."""
-        server_counts = {}
+        server_counts: defaultdict[str, dict[str, int]] = defaultdict(
+            lambda: {"critical": 0, "warning": 0}
+        )
 
         for alert in self.active_alerts.values():
-            server_alias = alert.server_alias
-            if server_alias not in server_counts:
-                server_counts[server_alias] = {"critical": 0, "warning": 0}
-            server_counts[server_alias][alert.severity] += 1
+            server_counts[alert.server_alias][alert.severity] += 1
 
         # Sort by total alerts (critical weighted higher)
-        sorted_servers = sorted(
+        top_servers = heapq.nlargest(
+            limit,
             server_counts.items(),
-            key=lambda x: x[1]["critical"] * 2 + x[1]["warning"],
-            reverse=True
+            key=lambda x: x[1]["critical"] * 2 + x[1]["warning"]
         )
 
         return [
@@ -343,26 +389,18 @@ class AlertEngine:
                 "warning_alerts": counts["warning"],
                 "total_alerts": counts["critical"] + counts["warning"]
             }
-            for server, counts in sorted_servers[:limit]
+            for server, counts in top_servers
         ]
 
     def _get_most_common_alerts(self, limit: int = 5) -> list[dict[str, Any]]:
         """Get most common alert types."""
-        rule_counts = {}
-
-        for alert in self.alert_history:
-            # Only count recent alerts
-            if (datetime.now() - alert.timestamp).total_seconds() < 86400:  # 24 hours
-                rule_name = alert.rule_name
-                if rule_name not in rule_counts:
-                    rule_counts[rule_name] = 0
-                rule_counts[rule_name] += 1
-
-        sorted_rules = sorted(rule_counts.items(), key=lambda x: x[1], reverse=True)
+        # Only count recent alerts
+        rule_counts = self.group_counts(hours=24, by="rule")
+        top_rules = heapq.nlargest(limit, rule_counts.items(), key=lambda x: x[1])
 
         return [
             {"rule_name": rule, "count": count}
-            for rule, count in sorted_rules[:limit]
+            for rule, count in top_rules
         ]
 
     async def check_server_health_alerts(self) -> list[Alert]:
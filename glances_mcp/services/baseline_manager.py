@@ -245,10 +245,33 @@ class BaselineManager:
         window_minutes: int = 60
     ) -> dict[str, Any] | None:
         """Get trend analysis for a metric."""
+        cutoff_time = datetime.now() - timedelta(minutes=window_minutes)
+        return self._trend_since(server_alias, metric, cutoff_time, window_minutes)
+
+    def get_trend_analyses(
+        self,
+        server_alias: str,
+        metrics: list[str],
+        window_minutes: int = 60
+    ) -> dict[str, dict[str, Any] | None]:
+        """Get trend analyses for several metrics of a server over the same window."""
+        cutoff_time = datetime.now() - timedelta(minutes=window_minutes)
+        return {
+            metric: self._trend_since(server_alias, metric, cutoff_time, window_minutes)
+            for metric in metrics
+        }
+
+    def _trend_since(
+        self,
+        server_alias: str,
+        metric: str,
+        cutoff_time: datetime,
+        window_minutes: int
+    ) -> dict[str, Any] | None:
+        """Calculate the trend of a metric from points newer than cutoff_time."""
         buffer = self._get_server_data_buffer(server_alias, metric)
 
         # Get recent points
-        cutoff_time = datetime.now() - timedelta(minutes=window_minutes)
         all_points = buffer.get_all()
 
         recent_points = [
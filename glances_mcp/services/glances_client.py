@@ -1,12 +1,16 @@
 """Glances API client for the MCP server."""
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime
+from time import monotonic, perf_counter
 from typing import Any, cast
 
 import aiohttp
+import pydantic_core
 
 from glances_mcp.config.models import GlancesServer, HealthStatus, ServerStatus
+from glances_mcp.config.settings import settings
 from glances_mcp.utils.helpers import (
     RateLimiter,
     async_timeout,
@@ -35,6 +39,8 @@ class GlancesClient:
         self._last_health_check: datetime | None = None
         self._cached_version: str | None = None
         self._cached_capabilities: list[str] = []
+        self._all_stats_cache: tuple[float, dict[str, Any]] | None = None
+        self._all_stats_ttl = 2.0  # seconds
 
     async def __aenter__(self) -> "GlancesClient":
         """Async context manager entry."""
@@ -101,7 +107,7 @@ class GlancesClient:
             raise GlancesApiError("Rate limit exceeded", self.server.alias)
 
         url = f"{self.server.base_url}/api/3/{endpoint}"
-        start_time = datetime.now()
+        start_time = perf_counter()
 
         try:
             if not self.session:
@@ -111,7 +117,7 @@ class GlancesClient:
                 raise GlancesApiError("Session not initialized", self.server.alias)
 
             async with self.session.get(url) as response:
-                response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+                response_time_ms = (perf_counter() - start_time) * 1000
 
                 self.rate_limiter.record_call()
 
@@ -123,7 +129,9 @@ class GlancesClient:
                 )
 
                 if response.status == 200:
-                    data = await response.json()
+                    # pydantic-core's Rust parser is much faster than json.loads on
+                    # large payloads such as /all and the process list
+                    data = await response.json(loads=pydantic_core.from_json)
                     logger.debug(
                         "Glances API request successful",
                         server_alias=self.server.alias,
@@ -159,13 +167,13 @@ class GlancesClient:
 
     async def health_check(self) -> ServerStatus:
         """Perform health check on the Glances server."""
-        start_time = datetime.now()
+        start_time = perf_counter()
 
         try:
             # Try to get basic system info
             await self._make_request("system")
 
-            response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            response_time_ms = (perf_counter() - start_time) * 1000
 
             # Get version and capabilities if not cached
             if self._cached_version is None:
@@ -298,8 +306,33 @@ class GlancesClient:
             return {}
 
     async def get_all_stats(self) -> dict[str, Any]:
-        """Get all available statistics."""
-        return await self._make_request("all")
+        """Get all available statistics, reusing a response for a couple of seconds."""
+        now = monotonic()
+        if self._all_stats_cache is not None and now - self._all_stats_cache[0] < self._all_stats_ttl:
+            return self._all_stats_cache[1]
+
+        all_stats = await self._make_request("all")
+        self._all_stats_cache = (now, all_stats)
+        return all_stats
+
+    async def get_plugins(self, *plugins: str) -> list[Any]:
+        """Get several plugins' statistics from a single /all request."""
+        all_stats = await self.get_all_stats()
+
+        # Fall back to the plugin's own endpoint for anything /all left out
+        missing = [plugin for plugin in plugins if plugin not in all_stats]
+        if missing:
+            fetched = await asyncio.gather(*(self._make_raw_request(plugin) for plugin in missing))
+            # _make_raw_request wraps non-dict payloads; unwrap to match /all
+            all_stats = {
+                **all_stats,
+                **{
+                    plugin: data["data"] if data.keys() == {"data"} else data
+                    for plugin, data in zip(missing, fetched, strict=True)
+                }
+            }
+
+        return [all_stats[plugin] for plugin in plugins]
 
 
 class GlancesClientPool:
@@ -308,8 +341,10 @@ class GlancesClientPool:
     def __init__(self, servers: list[GlancesServer]):
         self.servers = {server.alias: server for server in servers}
         self.clients: dict[str, GlancesClient] = {}
+        self._enabled_clients: dict[str, GlancesClient] | None = None
         self._health_cache: dict[str, ServerStatus] = {}
         self._health_cache_ttl = 60  # seconds
+        self._health_inflight: dict[str, asyncio.Task[ServerStatus]] = {}
 
     async def initialize(self) -> None:
         """Initialize all clients."""
@@ -317,6 +352,7 @@ class GlancesClientPool:
             client = GlancesClient(server)
             await client.connect()
             self.clients[server.alias] = client
+        self._enabled_clients = None
 
     async def close_all(self) -> None:
         """Close all client connections."""
@@ -328,6 +364,8 @@ class GlancesClientPool:
             await asyncio.gather(*tasks, return_exceptions=True)
 
         self.clients.clear()
+        self._enabled_clients = None
+        self._health_inflight.clear()
 
     def get_client(self, server_alias: str) -> GlancesClient | None:
         """Get client for specific server."""
@@ -335,11 +373,22 @@ class GlancesClientPool:
 
     def get_enabled_clients(self) -> dict[str, GlancesClient]:
         """Get all clients for enabled servers."""
-        enabled_clients = {}
-        for alias, server in self.servers.items():
-            if server.enabled and alias in self.clients:
-                enabled_clients[alias] = self.clients[alias]
-        return enabled_clients
+        # Built once per initialize() and shared between callers; do not mutate
+        if self._enabled_clients is None:
+            self._enabled_clients = {
+                alias: self.clients[alias]
+                for alias, server in self.servers.items()
+                if server.enabled and alias in self.clients
+            }
+        return self._enabled_clients
+
+    @property
+    def enabled_count(self) -> int:
+        """Number of enabled servers with a client, without building a dict."""
+        return sum(
+            1 for alias, server in self.servers.items()
+            if server.enabled and alias in self.clients
+        )
 
     async def health_check_all(self, use_cache: bool = True) -> dict[str, ServerStatus]:
         """Perform health check on all servers."""
@@ -355,17 +404,17 @@ class GlancesClientPool:
                     if age < self._health_cache_ttl:
                         results[alias] = cached_status
 
-        # Health check servers not in cache or cache disabled
-        tasks = []
-        for alias, client in self.clients.items():
-            if alias not in results:
-                tasks.append(self._health_check_single(alias, client))
+        # Health check servers not in cache or cache disabled; concurrent
+        # callers share the probe already in flight for a server
+        stale = [alias for alias in self.clients if alias not in results]
 
-        if tasks:
-            health_results = await asyncio.gather(*tasks, return_exceptions=True)
+        if stale:
+            health_results = await asyncio.gather(
+                *(asyncio.shield(self._health_probe(alias)) for alias in stale),
+                return_exceptions=True
+            )
 
-            for i, result in enumerate(health_results):
-                alias = list(self.clients.keys())[i]
+            for alias, result in zip(stale, health_results, strict=True):
                 if isinstance(result, ServerStatus):
                     results[alias] = result
                     self._health_cache[alias] = result
@@ -387,6 +436,23 @@ class GlancesClientPool:
 
         return results
 
+    async def health_check_server(self, alias: str) -> ServerStatus:
+        """Perform a time-bounded health check on one server."""
+        status = await asyncio.shield(self._health_probe(alias))
+        self._health_cache[alias] = status
+        return status
+
+    def _health_probe(self, alias: str) -> asyncio.Task[ServerStatus]:
+        """Return the in-flight health check for a server, starting one if needed."""
+        inflight = self._health_inflight
+        task = inflight.get(alias)
+        if task is None:
+            task = asyncio.create_task(self._health_check_single(alias, self.clients[alias]))
+            inflight[alias] = task
+            # Forget the probe once it settles so its result is not held onto
+            task.add_done_callback(lambda _: inflight.pop(alias, None))
+        return task
+
     async def _health_check_single(self, alias: str, client: GlancesClient) -> ServerStatus:
         """Perform health check on a single server."""
         try:
@@ -400,3 +466,58 @@ class GlancesClientPool:
                     timestamp=datetime.now()
                 )
             )
+
+
+async def fetch_from_servers(
+    clients: dict[str, GlancesClient],
+    fetch: Callable[[str, GlancesClient], Awaitable[dict[str, Any]]],
+    now_iso: str,
+    max_concurrency: int | None = None,
+    timeout_factor: float | None = None
+) -> dict[str, Any]:
+    """Run a per-server fetch concurrently, bounded and with a per-server deadline."""
+    # Both default to settings: max_concurrent_requests and server_fetch_timeout_factor
+    semaphore = asyncio.Semaphore(max_concurrency or settings.max_concurrent_requests)
+    factor = timeout_factor or settings.server_fetch_timeout_factor
+
+    async def fetch_with_deadline(alias: str, client: GlancesClient) -> tuple[str, dict[str, Any]]:
+        # Spans every request the fetch makes, so a multiple of the per-request timeout;
+        # a single slow request still fails first with the client's own timeout error.
+        # The clock starts once a slot is free, so queueing never counts against it
+        deadline = client.server.timeout * factor
+        async with semaphore:
+            try:
+                return alias, await asyncio.wait_for(fetch(alias, client), timeout=deadline)
+            except TimeoutError:
+                logger.warning(
+                    "Timed out fetching data for server",
+                    server_alias=alias,
+                    timeout_seconds=deadline
+                )
+                return alias, {
+                    "server_alias": alias,
+                    "error": f"Timed out after {deadline:g} seconds",
+                    "timestamp": now_iso
+                }
+            except Exception as e:
+                # Fetches only handle GlancesApiError; anything else must not sink the fleet
+                logger.warning(
+                    "Error fetching data for server",
+                    server_alias=alias,
+                    error=str(e)
+                )
+                return alias, {
+                    "server_alias": alias,
+                    "error": str(e),
+                    "timestamp": now_iso
+                }
+
+    results: dict[str, Any] = {}
+    for next_done in asyncio.as_completed(
+        [fetch_with_deadline(alias, client) for alias, client in clients.items()]
+    ):
+        alias, data = await next_done
+        results[alias] = data
+
+    # Report servers in configuration order regardless of completion order
+    return {alias: results[alias] for alias in clients}
@@ -1,6 +1,7 @@
 """Health score calculation service for Glances MCP server."""
 
 from datetime import datetime
+from time import perf_counter
 from typing import Any
 
 from glances_mcp.services.glances_client import GlancesClient
@@ -42,10 +43,10 @@ class HealthCalculator:
         if weights is None:
             weights = self.default_weights.copy()
 
-        start_time = datetime.now()
+        start_time = perf_counter()
         health_data: dict[str, Any] = {
             "server_alias": client.server.alias,
-            "timestamp": start_time.isoformat(),
+            "timestamp": datetime.now().isoformat(),
             "overall_score": 0.0,
             "status": "unknown",
             "component_scores": {},
@@ -128,7 +129,7 @@ class HealthCalculator:
                 health_data["warnings"]
             )
 
-            calculation_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            calculation_time_ms = (perf_counter() - start_time) * 1000
 
             logger.debug(
                 "Health score calculated",
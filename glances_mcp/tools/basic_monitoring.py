@@ -1,883 +1,984 @@
 """Basic monitoring tools for Glances MCP server."""
 
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
+import heapq
+from operator import attrgetter, itemgetter
 from typing import Any
 
 from fastmcp import FastMCP
 
 from glances_mcp.config.validation import InputValidator
-from glances_mcp.services.glances_client import GlancesApiError, GlancesClientPool
+from glances_mcp.services.glances_client import (
+    GlancesApiError,
+    GlancesClient,
+    GlancesClientPool,
+    fetch_from_servers,
+)
 from glances_mcp.utils.helpers import (
     format_bytes,
     format_percentage,
     format_uptime,
     safe_get,
 )
-from glances_mcp.utils.logging import logger, performance_logger
+from glances_mcp.utils.logging import logger, measured_tool
+
+# Sort order for list_servers; statuses not listed here rank after "unknown"
+_HEALTH_RANK = {"healthy": 0, "warning": 1, "degraded": 2, "critical": 3, "unknown": 4}
+
+# Top-level directories of pseudo filesystems left out of disk usage totals
+_SPECIAL_MOUNT_ROOTS = frozenset({"dev", "proc", "sys", "run"})
+
+# Name prefixes of loopback and virtual interfaces left out of network totals
+_VIRTUAL_INTERFACE_PREFIXES = ("lo", "docker", "veth", "br-")
+
+
+@dataclass(slots=True)
+class FilesystemUsage:
+    """Usage of one mounted filesystem as returned by get_disk_usage."""
+    device_name: str
+    mnt_point: str
+    fs_type: str
+    size: int
+    used: int
+    free: int
+    percent: float
+    size_formatted: str
+    used_formatted: str
+    free_formatted: str
+    usage_formatted: str
+
+
+@dataclass(slots=True)
+class InterfaceStats:
+    """Counters for one network interface as returned by get_network_stats."""
+    interface_name: str
+    rx_bytes: int
+    tx_bytes: int
+    rx_packets: int
+    tx_packets: int
+    rx_errors: int
+    tx_errors: int
+    rx_dropped: int
+    tx_dropped: int
+    rx_bytes_formatted: str
+    tx_bytes_formatted: str
+    error_rate: float
+    is_physical: bool
+
+
+@dataclass(slots=True)
+class ProcessInfo:
+    """One process row as returned by get_top_processes."""
+    pid: int
+    name: str
+    username: str
+    cpu_percent: float
+    memory_percent: float
+    memory_info: dict[str, Any]
+    memory_rss: int
+    memory_vms: int
+    status: str
+    create_time: float
+    num_threads: int
+    nice: int
+    memory_rss_formatted: str
+    memory_vms_formatted: str
+    cpu_times: Any
+    cmdline: str
+
+
+@dataclass(slots=True)
+class ContainerInfo:
+    """One container row as returned by get_containers."""
+    id: str
+    name: str
+    image: str
+    status: str
+    is_running: bool
+    created: Any
+    cpu_percent: float
+    memory_usage: int
+    memory_limit: int
+    memory_percent: float
+    network_rx: int
+    network_tx: int
+    io_r: int
+    io_w: int
+    memory_usage_formatted: str
+    memory_limit_formatted: str
+    network_rx_formatted: str
+    network_tx_formatted: str
 
 
 def register_basic_monitoring_tools(app: FastMCP, client_pool: GlancesClientPool) -> None:
     """Register basic monitoring tools with the MCP server."""
+    inflight: dict[tuple[Any, ...], asyncio.Task[dict[str, Any]]] = {}
+
+    async def coalesced(
+        key: tuple[Any, ...],
+        fetch: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Share one in-flight fan-out between concurrent calls with the same arguments."""
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        return await asyncio.shield(task)
 
     @app.tool()
-    async def list_servers() -> dict[str, Any]:
+    @measured_tool("list_servers")
+    async def list_servers(force_refresh: bool = False) -> dict[str, Any]:
         """List all configured Glances servers with their status and capabilities."""
-        start_time = datetime.now()
-
-        try:
-            # Get health status for all servers
-            health_statuses = await client_pool.health_check_all()
-
-            servers_info: list[dict[str, Any]] = []
-            for alias, server_config in client_pool.servers.items():
-                server_status = health_statuses.get(alias)
-
-                server_info = {
-                    "alias": server_config.alias,
-                    "host": server_config.host,
-                    "port": server_config.port,
-                    "protocol": server_config.protocol,
-                    "environment": server_config.environment.value if server_config.environment else None,
-                    "region": server_config.region,
-                    "tags": server_config.tags,
-                    "enabled": server_config.enabled,
-                    "status": {
-                        "health": server_status.health.status if server_status else "unknown",
-                        "message": server_status.health.message if server_status else "No status available",
-                        "last_check": server_status.health.timestamp.isoformat() if server_status else None,
-                        "response_time_ms": server_status.response_time_ms if server_status else None,
-                        "glances_version": server_status.glances_version if server_status else None,
-                        "capabilities": server_status.capabilities if server_status else []
-                    }
-                }
-                servers_info.append(server_info)
-
-            # Sort by health status (healthy first, then by alias)
-            servers_info.sort(key=lambda s: (
-                {"healthy": 0, "warning": 1, "degraded": 2, "critical": 3, "unknown": 4}.get(s["status"]["health"], 5),
-                s["alias"]
-            ))
-
-            result = {
-                "servers": servers_info,
-                "summary": {
-                    "total_servers": len(servers_info),
-                    "enabled_servers": len([s for s in servers_info if s["enabled"]]),
-                    "healthy_servers": len([s for s in servers_info if s["status"]["health"] == "healthy"]),
-                    "servers_with_issues": len([s for s in servers_info if s["status"]["health"] in ["warning", "critical"]]),
-                    "environments": list({s["environment"] for s in servers_info if s["environment"]}),
-                    "regions": list({s["region"] for s in servers_info if s["region"]})
+        # Get health status for all servers
+        health_statuses = await client_pool.health_check_all(use_cache=not force_refresh)
+
+        servers_info: list[dict[str, Any]] = []
+        for alias, server_config in client_pool.servers.items():
+            server_status = health_statuses.get(alias)
+
+            server_info = {
+                "alias": server_config.alias,
+                "host": server_config.host,
+                "port": server_config.port,
+                "protocol": server_config.protocol,
+                "environment": server_config.environment.value if server_config.environment else None,
+                "region": server_config.region,
+                "tags": server_config.tags,
+                "enabled": server_config.enabled,
+                "status": {
+                    "health": server_status.health.status if server_status else "unknown",
+                    "message": server_status.health.message if server_status else "No status available",
+                    "last_check": server_status.health.timestamp.isoformat() if server_status else None,
+                    "response_time_ms": server_status.response_time_ms if server_status else None,
+                    "glances_version": server_status.glances_version if server_status else None,
+                    "capabilities": server_status.capabilities if server_status else []
                 }
             }
+            servers_info.append(server_info)
+
+        # Sort by health status (healthy first, then by alias)
+        rank = _HEALTH_RANK.get
+        servers_info.sort(key=lambda s: (rank(s["status"]["health"], 5), s["alias"]))
+
+        enabled_servers = healthy_servers = servers_with_issues = 0
+        environments: set[str] = set()
+        regions: set[str] = set()
+        for info in servers_info:
+            if info["enabled"]:
+                enabled_servers += 1
+            health = info["status"]["health"]
+            if health == "healthy":
+                healthy_servers += 1
+            elif health in ("warning", "critical"):
+                servers_with_issues += 1
+            if info["environment"]:
+                environments.add(info["environment"])
+            if info["region"]:
+                regions.add(info["region"])
+
+        result = {
+            "servers": servers_info,
+            "summary": {
+                "total_servers": len(servers_info),
+                "enabled_servers": enabled_servers,
+                "healthy_servers": healthy_servers,
+                "servers_with_issues": servers_with_issues,
+                "environments": list(environments),
+                "regions": list(regions)
+            }
+        }
 
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("list_servers", duration_ms, True)
-
-            return result
-
-        except Exception as e:
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("list_servers", duration_ms, False)
-            logger.error("Error in list_servers", error=str(e))
-            raise
+        return result
 
     @app.tool()
-    async def get_server_status(server_alias: str | None = None) -> dict[str, Any]:
+    @measured_tool("get_server_status", "server_alias")
+    async def get_server_status(
+        server_alias: str | None = None,
+        force_refresh: bool = False
+    ) -> dict[str, Any]:
         """Get detailed status information for one or all servers."""
-        start_time = datetime.now()
-
-        try:
-            if server_alias:
-                # Validate server alias
-                if server_alias not in client_pool.servers:
-                    raise ValueError(f"Server '{server_alias}' not found")
-
-                client = client_pool.get_client(server_alias)
-                if not client:
-                    raise ValueError(f"Client for server '{server_alias}' not available")
-
-                server_status = await client.health_check()
-                servers_status = {server_alias: server_status}
-            else:
-                servers_status = await client_pool.health_check_all()
-
-            detailed_status = {}
-            for alias, status in servers_status.items():
-                server_config = client_pool.servers[alias]
-                env_value = server_config.environment.value if server_config.environment else None
-
-                detailed_status[alias] = {
-                    "health": status.health.status,
-                    "message": status.health.message,
-                    "timestamp": status.health.timestamp.isoformat(),
-                    "last_successful_connection": (
-                        status.last_successful_connection.isoformat()
-                        if status.last_successful_connection else None
-                    ),
-                    "response_time_ms": status.response_time_ms,
-                    "glances_version": status.glances_version,
-                    "capabilities": status.capabilities,
-                    "server_config": {
-                        "host": server_config.host,
-                        "port": server_config.port,
-                        "environment": env_value,
-                        "region": server_config.region,
-                        "tags": server_config.tags
-                    }
+        if server_alias:
+            # Validate server alias
+            if server_alias not in client_pool.servers:
+                raise ValueError(f"Server '{server_alias}' not found")
+
+            if not client_pool.get_client(server_alias):
+                raise ValueError(f"Client for server '{server_alias}' not available")
+
+            server_status = await client_pool.health_check_server(server_alias)
+            servers_status = {server_alias: server_status}
+        else:
+            servers_status = await client_pool.health_check_all(use_cache=not force_refresh)
+
+        detailed_status = {}
+        for alias, status in servers_status.items():
+            server_config = client_pool.servers[alias]
+            env_value = server_config.environment.value if server_config.environment else None
+
+            detailed_status[alias] = {
+                "health": status.health.status,
+                "message": status.health.message,
+                "timestamp": status.health.timestamp.isoformat(),
+                "last_successful_connection": (
+                    status.last_successful_connection.isoformat()
+                    if status.last_successful_connection else None
+                ),
+                "response_time_ms": status.response_time_ms,
+                "glances_version": status.glances_version,
+                "capabilities": status.capabilities,
+                "server_config": {
+                    "host": server_config.host,
+                    "port": server_config.port,
+                    "environment": env_value,
+                    "region": server_config.region,
+                    "tags": server_config.tags
                 }
+            }
 
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_server_status", duration_ms, True)
-
-            return {"servers": detailed_status}
-
-        except Exception as e:
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_server_status", duration_ms, False)
-            logger.error("Error in get_server_status", server_alias=server_alias, error=str(e))
-            raise
+        return {"servers": detailed_status}
 
     @app.tool()
+    @measured_tool("get_system_overview", "server_alias")
     async def get_system_overview(server_alias: str | None = None) -> dict[str, Any]:
         """Get system overview including CPU, memory, load, and uptime for one or all servers."""
-        start_time = datetime.now()
-
-        try:
-            clients = {}
-            if server_alias:
-                if server_alias not in client_pool.servers:
-                    raise ValueError(f"Server '{server_alias}' not found")
-                client = client_pool.get_client(server_alias)
-                if client:
-                    clients[server_alias] = client
-            else:
-                clients = client_pool.get_enabled_clients()
-
-            systems_overview = {}
-
-            for alias, client in clients.items():
-                try:
-                    # Get core system metrics
-                    system_data = await client.get_system_info()
-                    cpu_data = await client.get_cpu_info()
-                    memory_data = await client.get_memory_info()
-                    load_data = await client.get_load_average()
-                    uptime_data = await client.get_uptime()
-
-                    overview = {
-                        "server_alias": alias,
-                        "timestamp": datetime.now().isoformat(),
-                        "system": {
-                            "hostname": safe_get(system_data, "hostname", "unknown"),
-                            "platform": safe_get(system_data, "platform", "unknown"),
-                            "linux_distro": safe_get(system_data, "linux_distro", "unknown"),
-                            "hr_name": safe_get(system_data, "hr_name", "unknown")
-                        },
-                        "cpu": {
-                            "count": safe_get(system_data, "cpucount", 1),
-                            "total_usage": safe_get(cpu_data, "total", 0),
-                            "user": safe_get(cpu_data, "user", 0),
-                            "system": safe_get(cpu_data, "system", 0),
-                            "iowait": safe_get(cpu_data, "iowait", 0),
-                            "usage_formatted": format_percentage(safe_get(cpu_data, "total", 0))
-                        },
-                        "memory": {
-                            "total": safe_get(memory_data, "total", 0),
-                            "available": safe_get(memory_data, "available", 0),
-                            "used": safe_get(memory_data, "used", 0),
-                            "percent": safe_get(memory_data, "percent", 0),
-                            "total_formatted": format_bytes(safe_get(memory_data, "total", 0)),
-                            "available_formatted": format_bytes(safe_get(memory_data, "available", 0)),
-                            "usage_formatted": format_percentage(safe_get(memory_data, "percent", 0))
-                        },
-                        "load": {
-                            "min1": safe_get(load_data, "min1", 0),
-                            "min5": safe_get(load_data, "min5", 0),
-                            "min15": safe_get(load_data, "min15", 0),
-                            "cpucore": safe_get(load_data, "cpucore", 1)
-                        },
-                        "uptime": {
-                            "seconds": safe_get(uptime_data, "seconds", 0),
-                            "formatted": format_uptime(safe_get(uptime_data, "seconds", 0))
-                        }
-                    }
-
-                    systems_overview[alias] = overview
-
-                except GlancesApiError as e:
-                    logger.warning(
-                        "Error getting system overview for server",
-                        server_alias=alias,
-                        error=str(e)
-                    )
-                    systems_overview[alias] = {
-                        "server_alias": alias,
-                        "error": str(e),
-                        "timestamp": datetime.now().isoformat()
+        clients = _resolve_clients(client_pool, server_alias)
+
+        now_iso = datetime.now().isoformat()
+
+        async def fetch_overview(alias: str, client: GlancesClient) -> dict[str, Any]:
+            try:
+                # Get core system metrics
+                system_data, cpu_data, memory_data, load_data, uptime_data = await client.get_plugins(
+                    "system", "cpu", "mem", "load", "uptime"
+                )
+
+                overview = {
+                    "server_alias": alias,
+                    "timestamp": now_iso,
+                    "system": {
+                        "hostname": safe_get(system_data, "hostname", "unknown"),
+                        "platform": safe_get(system_data, "platform", "unknown"),
+                        "linux_distro": safe_get(system_data, "linux_distro", "unknown"),
+                        "hr_name": safe_get(system_data, "hr_name", "unknown")
+                    },
+                    "cpu": {
+                        "count": safe_get(system_data, "cpucount", 1),
+                        "total_usage": safe_get(cpu_data, "total", 0),
+                        "user": safe_get(cpu_data, "user", 0),
+                        "system": safe_get(cpu_data, "system", 0),
+                        "iowait": safe_get(cpu_data, "iowait", 0),
+                        "usage_formatted": format_percentage(safe_get(cpu_data, "total", 0))
+                    },
+                    "memory": {
+                        "total": safe_get(memory_data, "total", 0),
+                        "available": safe_get(memory_data, "available", 0),
+                        "used": safe_get(memory_data, "used", 0),
+                        "percent": safe_get(memory_data, "percent", 0),
+                        "total_formatted": format_bytes(safe_get(memory_data, "total", 0)),
+                        "available_formatted": format_bytes(safe_get(memory_data, "available", 0)),
+                        "usage_formatted": format_percentage(safe_get(memory_data, "percent", 0))
+                    },
+                    "load": {
+                        "min1": safe_get(load_data, "min1", 0),
+                        "min5": safe_get(load_data, "min5", 0),
+                        "min15": safe_get(load_data, "min15", 0),
+                        "cpucore": safe_get(load_data, "cpucore", 1)
+                    },
+                    "uptime": {
+                        "seconds": safe_get(uptime_data, "seconds", 0),
+                        "formatted": format_uptime(safe_get(uptime_data, "seconds", 0))
                     }
+                }
 
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_system_overview", duration_ms, True)
+                return overview
+
+            except GlancesApiError as e:
+                logger.warning(
+                    "Error getting system overview for server",
+                    server_alias=alias,
+                    error=str(e)
+                )
+                return {
+                    "server_alias": alias,
+                    "error": str(e),
+                    "timestamp": now_iso
+                }
 
-            return {"systems": systems_overview}
+        systems_overview = await coalesced(
+            ("get_system_overview", server_alias),
+            lambda: fetch_from_servers(clients, fetch_overview, now_iso)
+        )
 
-        except Exception as e:
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_system_overview", duration_ms, False)
-            logger.error("Error in get_system_overview", server_alias=server_alias, error=str(e))
-            raise
+        return {"systems": systems_overview}
 
     @app.tool()
+    @measured_tool("get_detailed_metrics", "server_alias")
     async def get_detailed_metrics(
         server_alias: str | None = None,
         include_sensors: bool = False
     ) -> dict[str, Any]:
         """Get detailed system metrics including extended CPU, memory, and I/O statistics."""
-        start_time = datetime.now()
-
-        try:
-            # Validate parameters
-            InputValidator.validate_tool_params(
-                "get_detailed_metrics",
-                {"server_alias": server_alias, "include_sensors": include_sensors}
-            )
-
-            clients = {}
-            if server_alias:
-                if server_alias not in client_pool.servers:
-                    raise ValueError(f"Server '{server_alias}' not found")
-                client = client_pool.get_client(server_alias)
-                if client:
-                    clients[server_alias] = client
-            else:
-                clients = client_pool.get_enabled_clients()
-
-            detailed_metrics = {}
-
-            for alias, client in clients.items():
-                try:
-                    # Get detailed metrics
-                    cpu_data = await client.get_cpu_info()
-                    memory_data = await client.get_memory_info()
-                    disk_io_data = await client.get_disk_io()
-
-                    metrics = {
-                        "server_alias": alias,
-                        "timestamp": datetime.now().isoformat(),
-                        "cpu_detailed": {
-                            "total": safe_get(cpu_data, "total", 0),
-                            "user": safe_get(cpu_data, "user", 0),
-                            "nice": safe_get(cpu_data, "nice", 0),
-                            "system": safe_get(cpu_data, "system", 0),
-                            "idle": safe_get(cpu_data, "idle", 0),
-                            "iowait": safe_get(cpu_data, "iowait", 0),
-                            "irq": safe_get(cpu_data, "irq", 0),
-                            "softirq": safe_get(cpu_data, "softirq", 0),
-                            "steal": safe_get(cpu_data, "steal", 0),
-                            "guest": safe_get(cpu_data, "guest", 0),
-                            "guest_nice": safe_get(cpu_data, "guest_nice", 0)
-                        },
-                        "memory_detailed": {
-                            "total": safe_get(memory_data, "total", 0),
-                            "available": safe_get(memory_data, "available", 0),
-                            "percent": safe_get(memory_data, "percent", 0),
-                            "used": safe_get(memory_data, "used", 0),
-                            "free": safe_get(memory_data, "free", 0),
-                            "active": safe_get(memory_data, "active", 0),
-                            "inactive": safe_get(memory_data, "inactive", 0),
-                            "buffers": safe_get(memory_data, "buffers", 0),
-                            "cached": safe_get(memory_data, "cached", 0),
-                            "shared": safe_get(memory_data, "shared", 0),
-                            "slab": safe_get(memory_data, "slab", 0)
-                        }
-                    }
-
-                    # Add disk I/O statistics
-                    if disk_io_data:
-                        io_stats = []
-                        for disk in disk_io_data:
-                            io_stat = {
-                                "disk_name": safe_get(disk, "disk_name", "unknown"),
-                                "read_count": safe_get(disk, "read_count", 0),
-                                "write_count": safe_get(disk, "write_count", 0),
-                                "read_bytes": safe_get(disk, "read_bytes", 0),
-                                "write_bytes": safe_get(disk, "write_bytes", 0),
-                                "read_time": safe_get(disk, "read_time", 0),
-                                "write_time": safe_get(disk, "write_time", 0),
-                                "read_bytes_formatted": format_bytes(safe_get(disk, "read_bytes", 0)),
-                                "write_bytes_formatted": format_bytes(safe_get(disk, "write_bytes", 0))
-                            }
-                            io_stats.append(io_stat)
-                        # Cast to Any to handle list assignment to Collection[str] typed dict
-                        metrics["disk_io"] = io_stats  # type: ignore[assignment]
-
-                    # Add sensor data if requested and available
-                    if include_sensors:
-                        try:
-                            sensors_data = await client.get_sensors()
-                            if sensors_data:
-                                metrics["sensors"] = sensors_data
-                        except Exception:
-                            pass  # Sensors might not be available
-
-                    detailed_metrics[alias] = metrics
-
-                except GlancesApiError as e:
-                    logger.warning(
-                        "Error getting detailed metrics for server",
-                        server_alias=alias,
-                        error=str(e)
-                    )
-                    detailed_metrics[alias] = {
-                        "server_alias": alias,
-                        "error": str(e),
-                        "timestamp": datetime.now().isoformat()
+        # Validate parameters
+        InputValidator.validate_tool_params(
+            "get_detailed_metrics",
+            {"server_alias": server_alias, "include_sensors": include_sensors}
+        )
+
+        clients = _resolve_clients(client_pool, server_alias)
+
+        now_iso = datetime.now().isoformat()
+
+        async def fetch_metrics(alias: str, client: GlancesClient) -> dict[str, Any]:
+            try:
+                # Get detailed metrics
+                (cpu_data, memory_data, disk_io_data), sensors_data = await asyncio.gather(
+                    client.get_plugins("cpu", "mem", "diskio"),
+                    _get_optional_sensors(client, include_sensors),
+                )
+
+                metrics = {
+                    "server_alias": alias,
+                    "timestamp": now_iso,
+                    "cpu_detailed": {
+                        "total": safe_get(cpu_data, "total", 0),
+                        "user": safe_get(cpu_data, "user", 0),
+                        "nice": safe_get(cpu_data, "nice", 0),
+                        "system": safe_get(cpu_data, "system", 0),
+                        "idle": safe_get(cpu_data, "idle", 0),
+                        "iowait": safe_get(cpu_data, "iowait", 0),
+                        "irq": safe_get(cpu_data, "irq", 0),
+                        "softirq": safe_get(cpu_data, "softirq", 0),
+                        "steal": safe_get(cpu_data, "steal", 0),
+                        "guest": safe_get(cpu_data, "guest", 0),
+                        "guest_nice": safe_get(cpu_data, "guest_nice", 0)
+                    },
+                    "memory_detailed": {
+                        "total": safe_get(memory_data, "total", 0),
+                        "available": safe_get(memory_data, "available", 0),
+                        "percent": safe_get(memory_data, "percent", 0),
+                        "used": safe_get(memory_data, "used", 0),
+                        "free": safe_get(memory_data, "free", 0),
+                        "active": safe_get(memory_data, "active", 0),
+                        "inactive": safe_get(memory_data, "inactive", 0),
+                        "buffers": safe_get(memory_data, "buffers", 0),
+                        "cached": safe_get(memory_data, "cached", 0),
+                        "shared": safe_get(memory_data, "shared", 0),
+                        "slab": safe_get(memory_data, "slab", 0)
                     }
+                }
 
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_detailed_metrics", duration_ms, True)
+                # Add disk I/O statistics
+                if disk_io_data:
+                    io_stats = []
+                    for disk in disk_io_data:
+                        read_bytes = disk.get("read_bytes", 0)
+                        write_bytes = disk.get("write_bytes", 0)
+                        io_stat = {
+                            "disk_name": disk.get("disk_name", "unknown"),
+                            "read_count": disk.get("read_count", 0),
+                            "write_count": disk.get("write_count", 0),
+                            "read_bytes": read_bytes,
+                            "write_bytes": write_bytes,
+                            "read_time": disk.get("read_time", 0),
+                            "write_time": disk.get("write_time", 0),
+                            "read_bytes_formatted": format_bytes(read_bytes),
+                            "write_bytes_formatted": format_bytes(write_bytes)
+                        }
+                        io_stats.append(io_stat)
+                    # Cast to Any to handle list assignment to Collection[str] typed dict
+                    metrics["disk_io"] = io_stats  # type: ignore[assignment]
+
+                # Add sensor data if requested and available
+                if sensors_data:
+                    metrics["sensors"] = sensors_data
+
+                return metrics
+
+            except GlancesApiError as e:
+                logger.warning(
+                    "Error getting detailed metrics for server",
+                    server_alias=alias,
+                    error=str(e)
+                )
+                return {
+                    "server_alias": alias,
+                    "error": str(e),
+                    "timestamp": now_iso
+                }
 
-            return {"servers": detailed_metrics}
+        detailed_metrics = await coalesced(
+            ("get_detailed_metrics", server_alias, include_sensors),
+            lambda: fetch_from_servers(clients, fetch_metrics, now_iso)
+        )
 
-        except Exception as e:
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_detailed_metrics", duration_ms, False)
-            logger.error("Error in get_detailed_metrics", server_alias=server_alias, error=str(e))
-            raise
+        return {"servers": detailed_metrics}
 
     @app.tool()
-    async def get_disk_usage(server_alias: str | None = None) -> dict[str, Any]:
+    @measured_tool("get_disk_usage", "server_alias")
+    async def get_disk_usage(server_alias: str | None = None, compact: bool = False) -> dict[str, Any]:
         """Get disk usage information for all mount points."""
-        start_time = datetime.now()
-
-        try:
-            clients = {}
-            if server_alias:
-                if server_alias not in client_pool.servers:
-                    raise ValueError(f"Server '{server_alias}' not found")
-                client = client_pool.get_client(server_alias)
-                if client:
-                    clients[server_alias] = client
-            else:
-                clients = client_pool.get_enabled_clients()
-
-            servers_disk_usage = {}
-
-            for alias, client in clients.items():
-                try:
-                    disk_data = await client.get_disk_usage()
-
-                    filesystems = []
-                    total_size = 0
-                    total_used = 0
-                    total_free = 0
-
-                    for fs in disk_data:
-                        filesystem = {
-                            "device_name": safe_get(fs, "device_name", "unknown"),
-                            "mnt_point": safe_get(fs, "mnt_point", "unknown"),
-                            "fs_type": safe_get(fs, "fs_type", "unknown"),
-                            "size": safe_get(fs, "size", 0),
-                            "used": safe_get(fs, "used", 0),
-                            "free": safe_get(fs, "free", 0),
-                            "percent": safe_get(fs, "percent", 0),
-                            "size_formatted": format_bytes(safe_get(fs, "size", 0)),
-                            "used_formatted": format_bytes(safe_get(fs, "used", 0)),
-                            "free_formatted": format_bytes(safe_get(fs, "free", 0)),
-                            "usage_formatted": format_percentage(safe_get(fs, "percent", 0))
-                        }
-                        filesystems.append(filesystem)
-
-                        # Aggregate totals (excluding special filesystems)
-                        if not safe_get(fs, "mnt_point", "").startswith(("/dev", "/proc", "/sys", "/run")):
-                            total_size += safe_get(fs, "size", 0)
-                            total_used += safe_get(fs, "used", 0)
-                            total_free += safe_get(fs, "free", 0)
-
-                    # Sort by mount point
-                    filesystems.sort(key=lambda x: x["mnt_point"])
-
-                    usage_summary = {
-                        "server_alias": alias,
-                        "timestamp": datetime.now().isoformat(),
-                        "filesystems": filesystems,
-                        "summary": {
-                            "filesystem_count": len(filesystems),
-                            "total_size": total_size,
-                            "total_used": total_used,
-                            "total_free": total_free,
-                            "total_percent": (total_used / total_size * 100) if total_size > 0 else 0,
-                            "total_size_formatted": format_bytes(total_size),
-                            "total_used_formatted": format_bytes(total_used),
-                            "total_free_formatted": format_bytes(total_free),
-                            "critical_filesystems": [
-                                fs for fs in filesystems
-                                if fs["percent"] >= 95
-                            ],
-                            "warning_filesystems": [
-                                fs for fs in filesystems
-                                if 85 <= fs["percent"] < 95
-                            ]
-                        }
-                    }
-
-                    servers_disk_usage[alias] = usage_summary
-
-                except GlancesApiError as e:
-                    logger.warning(
-                        "Error getting disk usage for server",
-                        server_alias=alias,
-                        error=str(e)
+        clients = _resolve_clients(client_pool, server_alias)
+
+        now_iso = datetime.now().isoformat()
+
+        async def fetch_disk_usage(alias: str, client: GlancesClient) -> dict[str, Any]:
+            try:
+                disk_data = await client.get_disk_usage()
+
+                filesystems: list[FilesystemUsage] = []
+                critical_filesystems: list[FilesystemUsage] = []
+                warning_filesystems: list[FilesystemUsage] = []
+                total_size = 0
+                total_used = 0
+                total_free = 0
+
+                # Bind hot-loop callables once
+                add_filesystem = filesystems.append
+                fmt_bytes = format_bytes
+                fmt_percent = format_percentage
+
+                for fs in disk_data:
+                    mnt_point = fs.get("mnt_point") or "unknown"
+                    is_special = _is_special_mount(mnt_point)
+                    size = fs.get("size", 0)
+                    used = fs.get("used", 0)
+                    free = fs.get("free", 0)
+                    percent = fs.get("percent", 0)
+                    filesystem = FilesystemUsage(
+                        device_name=fs.get("device_name", "unknown"),
+                        mnt_point=mnt_point,
+                        fs_type=fs.get("fs_type", "unknown"),
+                        size=size,
+                        used=used,
+                        free=free,
+                        percent=percent,
+                        size_formatted=fmt_bytes(size),
+                        used_formatted=fmt_bytes(used),
+                        free_formatted=fmt_bytes(free),
+                        usage_formatted=fmt_percent(percent)
                     )
-                    servers_disk_usage[alias] = {
-                        "server_alias": alias,
-                        "error": str(e),
-                        "timestamp": datetime.now().isoformat()
+                    add_filesystem(filesystem)
+
+                    if percent >= 95:
+                        critical_filesystems.append(filesystem)
+                    elif percent >= 85:
+                        warning_filesystems.append(filesystem)
+
+                    # Aggregate totals (excluding special filesystems)
+                    if not is_special:
+                        total_size += size
+                        total_used += used
+                        total_free += free
+
+                # Sort by mount point
+                by_mount = attrgetter("mnt_point")
+                filesystems.sort(key=by_mount)
+                critical_filesystems.sort(key=by_mount)
+                warning_filesystems.sort(key=by_mount)
+
+                usage_summary = {
+                    "server_alias": alias,
+                    "timestamp": now_iso,
+                    "filesystems": filesystems,
+                    "summary": {
+                        "filesystem_count": len(filesystems),
+                        "total_size": total_size,
+                        "total_used": total_used,
+                        "total_free": total_free,
+                        "total_percent": (total_used / total_size * 100) if total_size > 0 else 0,
+                        "total_size_formatted": format_bytes(total_size),
+                        "total_used_formatted": format_bytes(total_used),
+                        "total_free_formatted": format_bytes(total_free),
+                        "critical_filesystems": critical_filesystems,
+                        "warning_filesystems": warning_filesystems
                     }
+                }
+
+                return usage_summary
+
+            except GlancesApiError as e:
+                logger.warning(
+                    "Error getting disk usage for server",
+                    server_alias=alias,
+                    error=str(e)
+                )
+                return {
+                    "server_alias": alias,
+                    "error": str(e),
+                    "timestamp": now_iso
+                }
 
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_disk_usage", duration_ms, True)
+        servers_disk_usage = await coalesced(
+            ("get_disk_usage", server_alias),
+            lambda: fetch_from_servers(clients, fetch_disk_usage, now_iso)
+        )
 
-            return {"servers": servers_disk_usage}
+        if compact:
+            servers_disk_usage = _compact_rows(servers_disk_usage, "filesystems")
 
-        except Exception as e:
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_disk_usage", duration_ms, False)
-            logger.error("Error in get_disk_usage", server_alias=server_alias, error=str(e))
-            raise
+        return {"servers": servers_disk_usage}
 
     @app.tool()
+    @measured_tool("get_network_stats", "server_alias")
     async def get_network_stats(server_alias: str | None = None) -> dict[str, Any]:
         """Get network interface statistics and traffic information."""
-        start_time = datetime.now()
-
-        try:
-            clients = {}
-            if server_alias:
-                if server_alias not in client_pool.servers:
-                    raise ValueError(f"Server '{server_alias}' not found")
-                client = client_pool.get_client(server_alias)
-                if client:
-                    clients[server_alias] = client
-            else:
-                clients = client_pool.get_enabled_clients()
-
-            servers_network_stats = {}
-
-            for alias, client in clients.items():
-                try:
-                    network_data = await client.get_network_interfaces()
-
-                    interfaces = []
-                    total_rx_bytes = 0
-                    total_tx_bytes = 0
-                    total_rx_packets = 0
-                    total_tx_packets = 0
-                    total_errors = 0
-
-                    for interface in network_data:
-                        interface_name = safe_get(interface, "interface_name", "unknown")
-
-                        # Skip loopback and other special interfaces for totals
-                        is_physical = not interface_name.startswith(("lo", "docker", "veth", "br-"))
-
-                        rx_bytes = safe_get(interface, "rx_bytes", 0)
-                        tx_bytes = safe_get(interface, "tx_bytes", 0)
-                        rx_packets = safe_get(interface, "rx_packets", 0)
-                        tx_packets = safe_get(interface, "tx_packets", 0)
-                        rx_errors = safe_get(interface, "rx_errors", 0)
-                        tx_errors = safe_get(interface, "tx_errors", 0)
-
-                        interface_info = {
-                            "interface_name": interface_name,
-                            "rx_bytes": rx_bytes,
-                            "tx_bytes": tx_bytes,
-                            "rx_packets": rx_packets,
-                            "tx_packets": tx_packets,
-                            "rx_errors": rx_errors,
-                            "tx_errors": tx_errors,
-                            "rx_dropped": safe_get(interface, "rx_dropped", 0),
-                            "tx_dropped": safe_get(interface, "tx_dropped", 0),
-                            "rx_bytes_formatted": format_bytes(rx_bytes),
-                            "tx_bytes_formatted": format_bytes(tx_bytes),
-                            "error_rate": (
-                                ((rx_errors + tx_errors) / (rx_packets + tx_packets) * 100)
-                                if (rx_packets + tx_packets) > 0 else 0
-                            ),
-                            "is_physical": is_physical
-                        }
-                        interfaces.append(interface_info)
-
-                        if is_physical:
-                            total_rx_bytes += rx_bytes
-                            total_tx_bytes += tx_bytes
-                            total_rx_packets += rx_packets
-                            total_tx_packets += tx_packets
-                            total_errors += rx_errors + tx_errors
-
-                    # Sort interfaces by name
-                    interfaces.sort(key=lambda x: x["interface_name"])
-
-                    network_summary = {
-                        "server_alias": alias,
-                        "timestamp": datetime.now().isoformat(),
-                        "interfaces": interfaces,
-                        "summary": {
-                            "interface_count": len(interfaces),
-                            "physical_interfaces": len([i for i in interfaces if i["is_physical"]]),
-                            "total_rx_bytes": total_rx_bytes,
-                            "total_tx_bytes": total_tx_bytes,
-                            "total_rx_packets": total_rx_packets,
-                            "total_tx_packets": total_tx_packets,
-                            "total_errors": total_errors,
-                            "total_rx_formatted": format_bytes(total_rx_bytes),
-                            "total_tx_formatted": format_bytes(total_tx_bytes),
-                            "overall_error_rate": (
-                                (total_errors / (total_rx_packets + total_tx_packets) * 100)
-                                if (total_rx_packets + total_tx_packets) > 0 else 0
-                            ),
-                            "interfaces_with_errors": [
-                                i["interface_name"] for i in interfaces
-                                if i["rx_errors"] > 0 or i["tx_errors"] > 0
-                            ]
-                        }
-                    }
-
-                    servers_network_stats[alias] = network_summary
-
-                except GlancesApiError as e:
-                    logger.warning(
-                        "Error getting network stats for server",
-                        server_alias=alias,
-                        error=str(e)
+        clients = _resolve_clients(client_pool, server_alias)
+
+        now_iso = datetime.now().isoformat()
+
+        async def fetch_network_stats(alias: str, client: GlancesClient) -> dict[str, Any]:
+            try:
+                network_data = await client.get_network_interfaces()
+
+                interfaces: list[InterfaceStats] = []
+                interfaces_with_errors = []
+                physical_interfaces = 0
+                total_rx_bytes = 0
+                total_tx_bytes = 0
+                total_rx_packets = 0
+                total_tx_packets = 0
+                total_errors = 0
+
+                # Bind hot-loop callables once
+                add_interface = interfaces.append
+                fmt_bytes = format_bytes
+
+                for interface in network_data:
+                    interface_name = interface.get("interface_name") or "unknown"
+
+                    # Skip loopback and other special interfaces for totals
+                    is_physical = not interface_name.startswith(_VIRTUAL_INTERFACE_PREFIXES)
+
+                    rx_bytes = interface.get("rx_bytes", 0)
+                    tx_bytes = interface.get("tx_bytes", 0)
+                    rx_packets = interface.get("rx_packets", 0)
+                    tx_packets = interface.get("tx_packets", 0)
+                    rx_errors = interface.get("rx_errors", 0)
+                    tx_errors = interface.get("tx_errors", 0)
+
+                    interface_info = InterfaceStats(
+                        interface_name=interface_name,
+                        rx_bytes=rx_bytes,
+                        tx_bytes=tx_bytes,
+                        rx_packets=rx_packets,
+                        tx_packets=tx_packets,
+                        rx_errors=rx_errors,
+                        tx_errors=tx_errors,
+                        rx_dropped=interface.get("rx_dropped", 0),
+                        tx_dropped=interface.get("tx_dropped", 0),
+                        rx_bytes_formatted=fmt_bytes(rx_bytes),
+                        tx_bytes_formatted=fmt_bytes(tx_bytes),
+                        error_rate=(
+                            ((rx_errors + tx_errors) / (rx_packets + tx_packets) * 100)
+                            if (rx_packets + tx_packets) > 0 else 0
+                        ),
+                        is_physical=is_physical
                     )
-                    servers_network_stats[alias] = {
-                        "server_alias": alias,
-                        "error": str(e),
-                        "timestamp": datetime.now().isoformat()
+                    add_interface(interface_info)
+
+                    if rx_errors > 0 or tx_errors > 0:
+                        interfaces_with_errors.append(interface_name)
+
+                    if is_physical:
+                        physical_interfaces += 1
+                        total_rx_bytes += rx_bytes
+                        total_tx_bytes += tx_bytes
+                        total_rx_packets += rx_packets
+                        total_tx_packets += tx_packets
+                        total_errors += rx_errors + tx_errors
+
+                # Sort interfaces by name
+                interfaces.sort(key=attrgetter("interface_name"))
+                interfaces_with_errors.sort()
+
+                network_summary = {
+                    "server_alias": alias,
+                    "timestamp": now_iso,
+                    "interfaces": interfaces,
+                    "summary": {
+                        "interface_count": len(interfaces),
+                        "physical_interfaces": physical_interfaces,
+                        "total_rx_bytes": total_rx_bytes,
+                        "total_tx_bytes": total_tx_bytes,
+                        "total_rx_packets": total_rx_packets,
+                        "total_tx_packets": total_tx_packets,
+                        "total_errors": total_errors,
+                        "total_rx_formatted": format_bytes(total_rx_bytes),
+                        "total_tx_formatted": format_bytes(total_tx_bytes),
+                        "overall_error_rate": (
+                            (total_errors / (total_rx_packets + total_tx_packets) * 100)
+                            if (total_rx_packets + total_tx_packets) > 0 else 0
+                        ),
+                        "interfaces_with_errors": interfaces_with_errors
                     }
+                }
 
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_network_stats", duration_ms, True)
+                return network_summary
+
+            except GlancesApiError as e:
+                logger.warning(
+                    "Error getting network stats for server",
+                    server_alias=alias,
+                    error=str(e)
+                )
+                return {
+                    "server_alias": alias,
+                    "error": str(e),
+                    "timestamp": now_iso
+                }
 
-            return {"servers": servers_network_stats}
+        servers_network_stats = await coalesced(
+            ("get_network_stats", server_alias),
+            lambda: fetch_from_servers(clients, fetch_network_stats, now_iso)
+        )
 
-        except Exception as e:
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_network_stats", duration_ms, False)
-            logger.error("Error in get_network_stats", server_alias=server_alias, error=str(e))
-            raise
+        return {"servers": servers_network_stats}
 
     @app.tool()
+    @measured_tool("get_top_processes", "server_alias")
     async def get_top_processes(
         server_alias: str | None = None,
         limit: int = 10,
         sort_by: str = "cpu",
-        filter_name: str | None = None
+        filter_name: str | None = None,
+        compact: bool = False
     ) -> dict[str, Any]:
         """Get top processes sorted by CPU or memory usage."""
-        start_time = datetime.now()
-
-        try:
-            # Validate parameters
-            InputValidator.validate_tool_params(
-                "get_top_processes",
-                {
-                    "server_alias": server_alias,
-                    "limit": limit,
-                    "sort_by": sort_by,
-                    "filter_name": filter_name
-                }
-            )
-
-            clients = {}
-            if server_alias:
-                if server_alias not in client_pool.servers:
-                    raise ValueError(f"Server '{server_alias}' not found")
-                client = client_pool.get_client(server_alias)
-                if client:
-                    clients[server_alias] = client
-            else:
-                clients = client_pool.get_enabled_clients()
-
-            servers_processes: dict[str, Any] = {}
-
-            for alias, client in clients.items():
-                try:
-                    processes_data = await client.get_processes()
-
-                    if not processes_data:
-                        servers_processes[alias] = {
-                            "server_alias": alias,
-                            "error": "No process data available",
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        continue
-
-                    # Filter processes if requested
-                    if filter_name:
-                        processes_data = [
-                            proc for proc in processes_data
-                            if filter_name.lower() in safe_get(proc, "name", "").lower()
-                        ]
-
-                    # Sort processes
-                    sort_key = "cpu_percent" if sort_by == "cpu" else "memory_percent"
-                    processes_data.sort(
-                        key=lambda p: safe_get(p, sort_key, 0),
-                        reverse=True
-                    )
+        # Validate parameters
+        InputValidator.validate_tool_params(
+            "get_top_processes",
+            {
+                "server_alias": server_alias,
+                "limit": limit,
+                "sort_by": sort_by,
+                "filter_name": filter_name
+            }
+        )
 
-                    # Limit results
-                    top_processes = processes_data[:limit]
-
-                    # Format process information
-                    formatted_processes = []
-                    for proc in top_processes:
-                        process_info = {
-                            "pid": safe_get(proc, "pid", 0),
-                            "name": safe_get(proc, "name", "unknown"),
-                            "username": safe_get(proc, "username", "unknown"),
-                            "cpu_percent": safe_get(proc, "cpu_percent", 0),
-                            "memory_percent": safe_get(proc, "memory_percent", 0),
-                            "memory_info": safe_get(proc, "memory_info", {}),
-                            "memory_rss": safe_get(proc, "memory_info", {}).get("rss", 0),
-                            "memory_vms": safe_get(proc, "memory_info", {}).get("vms", 0),
-                            "status": safe_get(proc, "status", "unknown"),
-                            "create_time": safe_get(proc, "create_time", 0),
-                            "num_threads": safe_get(proc, "num_threads", 0),
-                            "nice": safe_get(proc, "nice", 0),
-                            "memory_rss_formatted": format_bytes(
-                                safe_get(proc, "memory_info", {}).get("rss", 0)
-                            ),
-                            "memory_vms_formatted": format_bytes(
-                                safe_get(proc, "memory_info", {}).get("vms", 0)
-                            ),
-                            "cpu_times": safe_get(proc, "cpu_times", {})
-                        }
+        clients = _resolve_clients(client_pool, server_alias)
 
-                        # Add command line (truncated for security)
-                        cmdline = safe_get(proc, "cmdline", [])
-                        if cmdline:
-                            command_str = " ".join(cmdline)
-                            # Truncate very long command lines
-                            if len(command_str) > 100:
-                                command_str = command_str[:97] + "..."
-                            process_info["cmdline"] = command_str
-                        else:
-                            process_info["cmdline"] = safe_get(proc, "name", "unknown")
+        now_iso = datetime.now().isoformat()
 
-                        formatted_processes.append(process_info)
+        async def fetch_processes(alias: str, client: GlancesClient) -> dict[str, Any]:
+            try:
+                processes_data = await client.get_processes()
 
-                    # Calculate summary statistics
-                    # total_cpu = sum(safe_get(p, "cpu_percent", 0) for p in processes_data)
-                    # total_memory = sum(safe_get(p, "memory_percent", 0) for p in processes_data)
+                if not processes_data:
+                    return {
+                        "server_alias": alias,
+                        "error": "No process data available",
+                        "timestamp": now_iso
+                    }
 
-                    process_summary = {
+                # Filter by name and count statuses while the heap consumes
+                # the processes, so no filtered copy of the list is built. A
+                # lowered substring test beats an IGNORECASE regex search here
+                needle = filter_name.lower() if filter_name else None
+                status_counts: Counter[Any] = Counter()
+
+                def matching_processes() -> Iterator[dict[str, Any]]:
+                    for proc in processes_data:
+                        if needle and needle not in (proc.get("name") or "").lower():
+                            continue
+                        status_counts[proc.get("status")] += 1
+                        yield proc
+
+                # Select the top processes without sorting the whole list;
+                # Glances reports None for processes it could not sample yet
+                sort_key = "cpu_percent" if sort_by == "cpu" else "memory_percent"
+                top_processes = heapq.nlargest(
+                    limit,
+                    matching_processes(),
+                    key=lambda proc: proc.get(sort_key) or 0
+                )
+
+                # Nothing matched the name filter, so there is nothing to format
+                if not top_processes:
+                    return {
                         "server_alias": alias,
-                        "timestamp": datetime.now().isoformat(),
-                        "processes": formatted_processes,
+                        "timestamp": now_iso,
+                        "processes": [],
                         "summary": {
-                            "total_processes": len(processes_data),
-                            "displayed_processes": len(formatted_processes),
+                            "total_processes": 0,
+                            "displayed_processes": 0,
                             "sorted_by": sort_by,
                             "filter_applied": filter_name,
-                            "top_processes_cpu_total": sum(
-                                p["cpu_percent"] for p in formatted_processes
-                            ),
-                            "top_processes_memory_total": sum(
-                                p["memory_percent"] for p in formatted_processes
-                            ),
-                            "running_processes": len([
-                                p for p in processes_data
-                                if safe_get(p, "status") == "running"
-                            ]),
-                            "sleeping_processes": len([
-                                p for p in processes_data
-                                if safe_get(p, "status") == "sleeping"
-                            ])
+                            "top_processes_cpu_total": 0,
+                            "top_processes_memory_total": 0,
+                            "running_processes": 0,
+                            "sleeping_processes": 0
                         }
                     }
 
-                    servers_processes[alias] = process_summary
-
-                except GlancesApiError as e:
-                    logger.warning(
-                        "Error getting processes for server",
-                        server_alias=alias,
-                        error=str(e)
-                    )
-                    servers_processes[alias] = {
-                        "server_alias": alias,
-                        "error": str(e),
-                        "timestamp": datetime.now().isoformat()
+                # Format process information
+                formatted_processes = [_process_info(proc) for proc in top_processes]
+
+                # Calculate summary statistics
+                top_cpu_total = sum(map(attrgetter("cpu_percent"), formatted_processes))
+                top_memory_total = sum(map(attrgetter("memory_percent"), formatted_processes))
+
+                process_summary = {
+                    "server_alias": alias,
+                    "timestamp": now_iso,
+                    "processes": formatted_processes,
+                    "summary": {
+                        "total_processes": status_counts.total(),
+                        "displayed_processes": len(formatted_processes),
+                        "sorted_by": sort_by,
+                        "filter_applied": filter_name,
+                        "top_processes_cpu_total": top_cpu_total,
+                        "top_processes_memory_total": top_memory_total,
+                        "running_processes": status_counts["running"],
+                        "sleeping_processes": status_counts["sleeping"]
                     }
+                }
+
+                return process_summary
+
+            except GlancesApiError as e:
+                logger.warning(
+                    "Error getting processes for server",
+                    server_alias=alias,
+                    error=str(e)
+                )
+                return {
+                    "server_alias": alias,
+                    "error": str(e),
+                    "timestamp": now_iso
+                }
 
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_top_processes", duration_ms, True)
+        servers_processes: dict[str, Any] = await coalesced(
+            ("get_top_processes", server_alias, limit, sort_by, filter_name),
+            lambda: fetch_from_servers(clients, fetch_processes, now_iso)
+        )
 
-            return {"servers": servers_processes}
+        if compact:
+            servers_processes = _compact_rows(servers_processes, "processes")
 
-        except Exception as e:
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_top_processes", duration_ms, False)
-            logger.error("Error in get_top_processes", server_alias=server_alias, error=str(e))
-            raise
+        return {"servers": servers_processes}
 
     @app.tool()
+    @measured_tool("get_containers", "server_alias")
     async def get_containers(
         server_alias: str | None = None,
         include_stopped: bool = False
     ) -> dict[str, Any]:
         """Get Docker/Podman container information and statistics."""
-        start_time = datetime.now()
-
-        try:
-            # Validate parameters
-            InputValidator.validate_tool_params(
-                "get_containers",
-                {
-                    "server_alias": server_alias,
-                    "include_stopped": include_stopped
-                }
-            )
-
-            clients = {}
-            if server_alias:
-                if server_alias not in client_pool.servers:
-                    raise ValueError(f"Server '{server_alias}' not found")
-                client = client_pool.get_client(server_alias)
-                if client:
-                    clients[server_alias] = client
-            else:
-                clients = client_pool.get_enabled_clients()
-
-            servers_containers: dict[str, Any] = {}
-
-            for alias, client in clients.items():
-                try:
-                    containers_data = await client.get_containers()
-
-                    if not containers_data:
-                        servers_containers[alias] = {
-                            "server_alias": alias,
-                            "containers": [],
-                            "summary": {
-                                "total_containers": 0,
-                                "running_containers": 0,
-                                "stopped_containers": 0,
-                                "containers_available": False
-                            },
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        continue
-
-                    # Filter containers by status if requested
-                    if not include_stopped:
-                        containers_data = [
-                            container for container in containers_data
-                            if safe_get(container, "Status", "").startswith("Up")
-                        ]
-
-                    # Format container information
-                    formatted_containers = []
-                    running_count = 0
-                    stopped_count = 0
-
-                    for container in containers_data:
-                        status = safe_get(container, "Status", "unknown")
-                        is_running = status.startswith("Up")
-
-                        if is_running:
-                            running_count += 1
-                        else:
-                            stopped_count += 1
-
-                        container_info = {
-                            "id": safe_get(container, "Id", "unknown")[:12],  # Short ID
-                            "name": safe_get(container, "name", "unknown"),
-                            "image": safe_get(container, "image", "unknown"),
-                            "status": status,
-                            "is_running": is_running,
-                            "created": safe_get(container, "created", "unknown"),
-                            "cpu_percent": safe_get(container, "cpu_percent", 0),
-                            "memory_usage": safe_get(container, "memory_usage", 0),
-                            "memory_limit": safe_get(container, "memory_limit", 0),
-                            "memory_percent": safe_get(container, "memory_percent", 0),
-                            "network_rx": safe_get(container, "network_rx", 0),
-                            "network_tx": safe_get(container, "network_tx", 0),
-                            "io_r": safe_get(container, "io_r", 0),
-                            "io_w": safe_get(container, "io_w", 0),
-                            "memory_usage_formatted": format_bytes(
-                                safe_get(container, "memory_usage", 0)
-                            ),
-                            "memory_limit_formatted": format_bytes(
-                                safe_get(container, "memory_limit", 0)
-                            ),
-                            "network_rx_formatted": format_bytes(
-                                safe_get(container, "network_rx", 0)
-                            ),
-                            "network_tx_formatted": format_bytes(
-                                safe_get(container, "network_tx", 0)
-                            )
-                        }
-
-                        formatted_containers.append(container_info)
-
-                    # Sort by CPU usage (descending)
-                    formatted_containers.sort(
-                        key=lambda c: c["cpu_percent"],
-                        reverse=True
-                    )
+        # Argument types are enforced by the tool schema; there are no
+        # range or choice constraints left for InputValidator to check
+        clients = _resolve_clients(client_pool, server_alias)
 
-                    container_summary = {
-                        "server_alias": alias,
-                        "timestamp": datetime.now().isoformat(),
-                        "containers": formatted_containers,
-                        "summary": {
-                            "total_containers": len(containers_data),
-                            "running_containers": running_count,
-                            "stopped_containers": stopped_count,
-                            "displayed_containers": len(formatted_containers),
-                            "include_stopped": include_stopped,
-                            "containers_available": True,
-                            "total_cpu_usage": sum(
-                                c["cpu_percent"] for c in formatted_containers
-                            ),
-                            "total_memory_usage": sum(
-                                c["memory_usage"] for c in formatted_containers
-                            ),
-                            "total_memory_usage_formatted": format_bytes(
-                                sum(c["memory_usage"] for c in formatted_containers)
-                            )
-                        }
-                    }
+        now_iso = datetime.now().isoformat()
 
-                    servers_containers[alias] = container_summary
+        async def fetch_containers(alias: str, client: GlancesClient) -> dict[str, Any]:
+            try:
+                containers_data = await client.get_containers()
 
-                except GlancesApiError as e:
-                    logger.warning(
-                        "Error getting containers for server",
-                        server_alias=alias,
-                        error=str(e)
-                    )
-                    servers_containers[alias] = {
+                if not containers_data:
+                    return {
                         "server_alias": alias,
-                        "error": str(e),
                         "containers": [],
                         "summary": {
+                            "total_containers": 0,
+                            "running_containers": 0,
+                            "stopped_containers": 0,
                             "containers_available": False
                         },
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": now_iso
                     }
 
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_containers", duration_ms, True)
+                # Format container information, skipping stopped containers
+                # unless requested
+                rows = map(_container_info, containers_data)
+                formatted_containers = list(
+                    rows if include_stopped else filter(attrgetter("is_running"), rows)
+                )
+
+                running_count = sum(map(attrgetter("is_running"), formatted_containers))
+                stopped_count = len(formatted_containers) - running_count
+                total_cpu_usage = sum(map(attrgetter("cpu_percent"), formatted_containers))
+                total_memory_usage = sum(map(attrgetter("memory_usage"), formatted_containers))
+
+                # Sort by CPU usage (descending)
+                formatted_containers.sort(
+                    key=attrgetter("cpu_percent"),
+                    reverse=True
+                )
+
+                container_summary = {
+                    "server_alias": alias,
+                    "timestamp": now_iso,
+                    "containers": formatted_containers,
+                    "summary": {
+                        "total_containers": len(formatted_containers),
+                        "running_containers": running_count,
+                        "stopped_containers": stopped_count,
+                        "displayed_containers": len(formatted_containers),
+                        "include_stopped": include_stopped,
+                        "containers_available": True,
+                        "total_cpu_usage": total_cpu_usage,
+                        "total_memory_usage": total_memory_usage,
+                        "total_memory_usage_formatted": format_bytes(total_memory_usage)
+                    }
+                }
 
-            return {"servers": servers_containers}
+                return container_summary
+
+            except GlancesApiError as e:
+                logger.warning(
+                    "Error getting containers for server",
+                    server_alias=alias,
+                    error=str(e)
+                )
+                return {
+                    "server_alias": alias,
+                    "error": str(e),
+                    "containers": [],
+                    "summary": {
+                        "containers_available": False
+                    },
+                    "timestamp": now_iso
+                }
 
-        except Exception as e:
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            performance_logger.log_tool_execution("get_containers", duration_ms, False)
-            logger.error("Error in get_containers", server_alias=server_alias, error=str(e))
-            raise
+        servers_containers = await coalesced(
+            ("get_containers", server_alias, include_stopped),
+            lambda: fetch_from_servers(clients, fetch_containers, now_iso)
+        )
+
+        return {"servers": servers_containers}
+
+
+def _is_special_mount(mnt_point: str) -> bool:
+    """Check whether a mount point lives under a pseudo filesystem root."""
+    root, _, _ = mnt_point.removeprefix("/").partition("/")
+    return mnt_point.startswith("/") and root in _SPECIAL_MOUNT_ROOTS
+
+
+def _process_info(proc: dict[str, Any]) -> ProcessInfo:
+    """Build a ProcessInfo row from a Glances process entry."""
+    name = proc.get("name", "unknown")
+    memory_info = proc.get("memory_info") or {}
+    memory_rss = memory_info.get("rss", 0)
+    memory_vms = memory_info.get("vms", 0)
+
+    # Add command line (truncated for security)
+    cmdline = proc.get("cmdline", [])
+    command_str = _truncate_cmdline(cmdline) if cmdline else name
+
+    return ProcessInfo(
+        pid=proc.get("pid", 0),
+        name=name,
+        username=proc.get("username", "unknown"),
+        cpu_percent=proc.get("cpu_percent", 0),
+        memory_percent=proc.get("memory_percent", 0),
+        memory_info=memory_info,
+        memory_rss=memory_rss,
+        memory_vms=memory_vms,
+        status=proc.get("status", "unknown"),
+        create_time=proc.get("create_time", 0),
+        num_threads=proc.get("num_threads", 0),
+        nice=proc.get("nice", 0),
+        memory_rss_formatted=format_bytes(memory_rss),
+        memory_vms_formatted=format_bytes(memory_vms),
+        cpu_times=proc.get("cpu_times", {}),
+        cmdline=command_str
+    )
+
+
+def _container_info(container: dict[str, Any]) -> ContainerInfo:
+    """Build a ContainerInfo row from a Glances container entry."""
+    status = container.get("Status", "unknown")
+    memory_usage = container.get("memory_usage", 0)
+    memory_limit = container.get("memory_limit", 0)
+    network_rx = container.get("network_rx", 0)
+    network_tx = container.get("network_tx", 0)
+
+    return ContainerInfo(
+        id=container.get("Id", "unknown")[:12],  # Short ID
+        name=container.get("name", "unknown"),
+        image=container.get("image", "unknown"),
+        status=status,
+        is_running=status.startswith("Up"),
+        created=container.get("created", "unknown"),
+        cpu_percent=container.get("cpu_percent", 0),
+        memory_usage=memory_usage,
+        memory_limit=memory_limit,
+        memory_percent=container.get("memory_percent", 0),
+        network_rx=network_rx,
+        network_tx=network_tx,
+        io_r=container.get("io_r", 0),
+        io_w=container.get("io_w", 0),
+        memory_usage_formatted=format_bytes(memory_usage),
+        memory_limit_formatted=format_bytes(memory_limit),
+        network_rx_formatted=format_bytes(network_rx),
+        network_tx_formatted=format_bytes(network_tx)
+    )
+
+
+def _truncate_cmdline(cmdline: list[str], max_length: int = 100) -> str:
+    """Join a command line, truncating it to max_length characters."""
+    # Stop collecting arguments once the joined length passes the limit
+    parts: list[str] = []
+    length = -1
+    for arg in cmdline:
+        parts.append(arg)
+        length += len(arg) + 1
+        if length > max_length:
+            return " ".join(parts)[:max_length - 3] + "..."
+    return " ".join(parts)
+
+
+def _resolve_clients(
+    client_pool: GlancesClientPool, server_alias: str | None
+) -> dict[str, GlancesClient]:
+    """Resolve the clients a tool queries: the named server, or all enabled servers."""
+    if not server_alias:
+        return client_pool.get_enabled_clients()
+
+    if server_alias not in client_pool.servers:
+        raise ValueError(f"Server '{server_alias}' not found")
+
+    client = client_pool.get_client(server_alias)
+    return {server_alias: client} if client else {}
+
+
+async def _get_optional_sensors(client: GlancesClient, include_sensors: bool) -> dict[str, Any]:
+    """Get sensor data if requested, treating unavailable sensors as no data."""
+    if not include_sensors:
+        return {}
+
+    try:
+        return await client.get_sensors()
+    except GlancesApiError as e:
+        logger.debug("Sensors not available for server", server_alias=client.server.alias, error=str(e))
+        return {}
+
+
+def _compact_rows(servers: dict[str, Any], key: str) -> dict[str, Any]:
+    """Reshape each server's row list under key into a columns header plus value rows."""
+    # Results may be shared with coalesced callers, so build new dicts
+    return {
+        alias: {**data, key: _to_table(data[key])} if key in data else data
+        for alias, data in servers.items()
+    }
+
+
+def _to_table(rows: list[Any]) -> dict[str, list[Any]]:
+    """Convert uniform dict or dataclass rows to a columns/rows table."""
+    if not rows:
+        return {"columns": [], "rows": []}
+
+    first = rows[0]
+    getter: Callable[[Any], Any]
+    if is_dataclass(first):
+        columns = [field.name for field in fields(first)]
+        getter = attrgetter(*columns)
+    else:
+        columns = list(first)
+        getter = itemgetter(*columns)
+    return {"columns": columns, "rows": [list(getter(row)) for row in rows]}
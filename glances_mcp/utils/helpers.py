@@ -1,30 +1,58 @@
 """Helper utilities for Glances MCP server."""
 
 import asyncio
+from collections import deque
 from collections.abc import Awaitable
 from datetime import datetime, timedelta
-import json
+from functools import lru_cache
+import math
+import re
+import secrets
+import time
 from typing import Any, TypeVar
 
+import pydantic_core
+
 T = TypeVar("T")
 
+# Marks a missing key where None is a legitimate value
+_MISSING = object()
+
+# Key fragments redacted by filter_sensitive_info; one alternation scan replaces
+# a substring test per fragment, and matching the lowered key beats IGNORECASE
+_SENSITIVE_KEY_RE = re.compile("password|token|key|secret|credential")
+
+# Indexed by power of 1024; dividing by these is exact in binary floating point
+_BYTE_UNITS = (
+    ("B", 1.0),
+    ("KB", 1024.0),
+    ("MB", 1024.0 ** 2),
+    ("GB", 1024.0 ** 3),
+    ("TB", 1024.0 ** 4),
+    ("PB", 1024.0 ** 5),
+)
+
 
+# Sized to hold the RSS and VMS values of a large process list between calls
+@lru_cache(maxsize=4096)
 def format_bytes(bytes_value: int) -> str:
     """Format bytes into human readable format."""
     if bytes_value == 0:
         return "0 B"
 
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    unit_index = 0
     size = float(bytes_value)
+    # NaN and infinity have no bit length; JSON from Glances can carry either
+    if not math.isfinite(size):
+        return f"{size:.1f} {'PB' if size > 0 else 'B'}"
+    if size < 1024:
+        return f"{size:.1f} B"
 
-    while size >= 1024.0 and unit_index < len(units) - 1:
-        size /= 1024.0
-        unit_index += 1
-
-    return f"{size:.1f} {units[unit_index]}"
+    # Units step by 2**10, so the bit length of the whole bytes picks the unit directly
+    unit, scale = _BYTE_UNITS[min((int(size).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)]
+    return f"{size / scale:.1f} {unit}"
 
 
+@lru_cache(maxsize=2048)
 def format_percentage(value: float, decimal_places: int = 1) -> str:
     """Format a percentage value."""
     return f"{value:.{decimal_places}f}%"
@@ -32,18 +60,20 @@ def format_percentage(value: float, decimal_places: int = 1) -> str:
 
 def format_uptime(seconds: int) -> str:
     """Format uptime seconds into human readable format."""
+    # Each tier only splits off the units it prints
     if seconds < 60:
         return f"{seconds}s"
-    elif seconds < 3600:
-        return f"{seconds // 60}m {seconds % 60}s"
-    elif seconds < 86400:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
+
+    minutes, secs = divmod(seconds, 60)
+    if seconds < 3600:
+        return f"{minutes}m {secs}s"
+
+    hours, minutes = divmod(minutes, 60)
+    if seconds < 86400:
         return f"{hours}h {minutes}m"
-    else:
-        days = seconds // 86400
-        hours = (seconds % 86400) // 3600
-        return f"{days}d {hours}h"
+
+    days, hours = divmod(hours, 24)
+    return f"{days}d {hours}h"
 
 
 def format_rate(value: float, unit: str = "B/s") -> str:
@@ -66,13 +96,22 @@ def safe_get(data: dict[str, Any], path: str, default: Any = None) -> Any:
     if not path:
         return data
 
-    keys = path.split(".")
-    result = data
+    # Fast path for flat keys, which is how most callers use it
+    if "." not in path:
+        if isinstance(data, dict):
+            value = data.get(path, _MISSING)
+            if value is not _MISSING:
+                return value
+        return default
 
-    for key in keys:
-        if isinstance(result, dict) and key in result:
-            result = result[key]
-        else:
+    # Splitting is cheaper than an lru_cache lookup for paths this short
+    result: Any = data
+
+    for key in path.split("."):
+        if not isinstance(result, dict):
+            return default
+        result = result.get(key, _MISSING)
+        if result is _MISSING:
             return default
 
     return result
@@ -90,6 +129,12 @@ def calculate_percentile(values: list[float], percentile: float) -> float:
     if not values:
         return 0.0
 
+    # The extremes are a linear scan; anything in between needs an ordering
+    if percentile <= 0:
+        return min(values)
+    if percentile >= 100:
+        return max(values)
+
     sorted_values = sorted(values)
     index = (percentile / 100) * (len(sorted_values) - 1)
 
@@ -109,28 +154,49 @@ def is_within_maintenance_window(
     if not maintenance_windows:
         return False
 
+    return is_within_compiled_maintenance_window(
+        compile_maintenance_windows(maintenance_windows), current_time
+    )
+
+
+def compile_maintenance_windows(
+    maintenance_windows: list[dict[str, Any]]
+) -> list[tuple[frozenset[int], str, str]]:
+    """Precompute the weekdays and HH:MM bounds of each maintenance window."""
+    return [
+        (
+            frozenset(window.get("days_of_week", [])),
+            window.get("start_time", "00:00"),
+            window.get("end_time", "23:59")
+        )
+        for window in maintenance_windows
+    ]
+
+
+def is_within_compiled_maintenance_window(
+    compiled_windows: list[tuple[frozenset[int], str, str]],
+    current_time: datetime | None = None
+) -> bool:
+    """Check if current time is within any precompiled maintenance window."""
+    if not compiled_windows:
+        return False
+
     if current_time is None:
         current_time = datetime.now()
 
     # For simplicity, assume all times are in the same timezone
     current_weekday = current_time.weekday()  # 0=Monday, 6=Sunday
-    current_time_str = current_time.strftime("%H:%M")
-
-    for window in maintenance_windows:
-        if current_weekday in window.get("days_of_week", []):
-            start_time = window.get("start_time", "00:00")
-            end_time = window.get("end_time", "23:59")
+    current_time_str = f"{current_time.hour:02d}:{current_time.minute:02d}"
 
-            if start_time <= current_time_str <= end_time:
-                return True
-
-    return False
+    return any(
+        current_weekday in days and start_time <= current_time_str <= end_time
+        for days, start_time, end_time in compiled_windows
+    )
 
 
 def generate_correlation_id() -> str:
     """Generate a correlation ID for request tracking."""
-    import uuid
-    return str(uuid.uuid4())[:8]
+    return secrets.token_hex(4)
 
 
 def merge_metrics(metrics_list: list[dict[str, Any]]) -> dict[str, Any]:
@@ -138,27 +204,28 @@ def merge_metrics(metrics_list: list[dict[str, Any]]) -> dict[str, Any]:
     if not metrics_list:
         return {}
 
-    merged = {}
+    merged: dict[str, Any] = {}
 
     for metrics in metrics_list:
         for key, value in metrics.items():
-            if key not in merged:
+            # One lookup tells both whether the key is new and what it holds
+            current = merged.get(key, _MISSING)
+            if current is _MISSING:
                 merged[key] = value
-            elif isinstance(value, int | float) and isinstance(merged[key], int | float):
-                merged[key] += value
-            elif isinstance(value, list) and isinstance(merged[key], list):
-                merged[key].extend(value)
+            elif isinstance(value, int | float):
+                if isinstance(current, int | float):
+                    merged[key] = current + value
+            elif isinstance(value, list) and isinstance(current, list):
+                current.extend(value)
 
     return merged
 
 
 def filter_sensitive_info(data: dict[str, Any]) -> dict[str, Any]:
     """Remove sensitive information from data."""
-    sensitive_keys = ["password", "token", "key", "secret", "credential"]
-
     filtered: dict[str, Any] = {}
     for key, value in data.items():
-        if any(sensitive in key.lower() for sensitive in sensitive_keys):
+        if _SENSITIVE_KEY_RE.search(key.lower()):
             filtered[key] = "***REDACTED***"
         elif isinstance(value, dict):
             filtered[key] = filter_sensitive_info(value)
@@ -170,16 +237,19 @@ def filter_sensitive_info(data: dict[str, Any]) -> dict[str, Any]:
 
 async def async_timeout(coro: Awaitable[T], timeout_seconds: float) -> T:
     """Execute coroutine with timeout."""
+    # asyncio.timeout cancels in place rather than wrapping the coroutine in a task like wait_for
     try:
-        return await asyncio.wait_for(coro, timeout=timeout_seconds)
-    except TimeoutError:
-        raise TimeoutError(f"Operation timed out after {timeout_seconds} seconds") from None
+        async with asyncio.timeout(timeout_seconds):
+            return await coro
+    except TimeoutError as e:
+        raise TimeoutError(f"Operation timed out after {timeout_seconds} seconds") from e
 
 
 def validate_json_serializable(data: Any) -> Any:
     """Validate that data is JSON serializable, converting if necessary."""
     try:
-        json.dumps(data, default=str)
+        # The C encoder makes the probe a fraction of the cost of json.dumps
+        pydantic_core.to_json(data, fallback=str)
         return data
     except (TypeError, ValueError):
         # Convert problematic types to strings
@@ -193,33 +263,46 @@ def validate_json_serializable(data: Any) -> Any:
             return str(data)
 
 
+def to_json(data: Any, indent: int | None = 2) -> str:
+    """Serialize data to a JSON string using pydantic-core's native encoder."""
+    return pydantic_core.to_json(data, indent=indent, fallback=str).decode()
+
+
 class CircularBuffer:
     """Simple circular buffer for storing recent values."""
 
     def __init__(self, max_size: int):
         self.max_size = max_size
-        self.buffer: list[Any] = []
+        # Slots are allocated up front; index is the next slot to write
+        self.buffer: list[Any] = [None] * max_size
         self.index = 0
+        self.count = 0
 
     def append(self, value: Any) -> None:
         """Add value to buffer."""
-        if len(self.buffer) < self.max_size:
-            self.buffer.append(value)
-        else:
-            self.buffer[self.index] = value
-            self.index = (self.index + 1) % self.max_size
+        self.buffer[self.index] = value
+        self.index = (self.index + 1) % self.max_size
+        if self.count < self.max_size:
+            self.count += 1
 
     def get_all(self) -> list[Any]:
         """Get all values in chronological order."""
-        if len(self.buffer) < self.max_size:
-            return self.buffer.copy()
+        if self.count < self.max_size:
+            return self.buffer[:self.count]
         else:
             return self.buffer[self.index:] + self.buffer[:self.index]
 
     def get_recent(self, count: int) -> list[Any]:
         """Get most recent N values."""
-        all_values = self.get_all()
-        return all_values[-count:] if count < len(all_values) else all_values
+        count = min(count, self.count)
+        if count <= 0:
+            return []
+
+        # Slice just the requested tail instead of materializing the whole buffer
+        start = (self.index - count) % self.max_size
+        if start < self.index:
+            return self.buffer[start:self.index]
+        return self.buffer[start:] + self.buffer[:self.index]
 
 
 class RateLimiter:
@@ -228,18 +311,19 @@ class RateLimiter:
     def __init__(self, max_calls: int, time_window: int):
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls: list[float] = []
+        # Monotonic call times, oldest first, so expired calls drop off the left
+        self.calls: deque[float] = deque()
 
     def can_make_call(self) -> bool:
         """Check if a call can be made within rate limits."""
-        now = datetime.now().timestamp()
-
         # Remove calls outside the time window
-        cutoff = now - self.time_window
-        self.calls = [call_time for call_time in self.calls if call_time > cutoff]
+        cutoff = time.monotonic() - self.time_window
+        calls = self.calls
+        while calls and calls[0] <= cutoff:
+            calls.popleft()
 
-        return len(self.calls) < self.max_calls
+        return len(calls) < self.max_calls
 
     def record_call(self) -> None:
         """Record that a call was made."""
-        self.calls.append(datetime.now().timestamp())
+        self.calls.append(time.monotonic())
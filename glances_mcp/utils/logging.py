@@ -1,16 +1,23 @@
 """Structured logging configuration for Glances MCP server."""
 
+from collections.abc import Awaitable, Callable
 from datetime import datetime
+import functools
+import inspect
 import logging
 import sys
+from time import perf_counter
 import types
-from typing import Any, cast
+from typing import Any, ParamSpec, TypeVar, cast
 
 import structlog
 from structlog.typing import FilteringBoundLogger
 
 from glances_mcp.config.settings import settings
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
 
 def configure_logging() -> FilteringBoundLogger:
     """Configure structured logging for the application."""
@@ -56,6 +63,7 @@ class RequestLogger:
         self.logger = logger
         self.request_id = request_id
         self.start_time = datetime.now()
+        self._started = perf_counter()
 
     def __enter__(self) -> FilteringBoundLogger:
         """Enter context with request logging."""
@@ -69,7 +77,7 @@ class RequestLogger:
     def __exit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: types.TracebackType | None) -> None:
         """Exit context with request logging."""
         end_time = datetime.now()
-        duration_ms = (end_time - self.start_time).total_seconds() * 1000
+        duration_ms = (perf_counter() - self._started) * 1000
 
         if exc_type:
             self.bound_logger.error(
@@ -101,20 +109,23 @@ class PerformanceLogger:
         metadata: dict[str, Any] | None = None
     ) -> None:
         """Log performance metrics for an operation."""
-        log_data = {
-            "operation": operation,
-            "duration_ms": duration_ms,
-            "success": success,
-            "timestamp": datetime.now().isoformat()
-        }
-
-        if metadata:
-            log_data.update(metadata)
-
+        # TimeStamper stamps every event, so no timestamp is added here
         if success:
-            self.logger.info("Operation completed", **log_data)
+            self.logger.info(
+                "Operation completed",
+                operation=operation,
+                duration_ms=duration_ms,
+                success=success,
+                **(metadata or {})
+            )
         else:
-            self.logger.warning("Operation failed", **log_data)
+            self.logger.warning(
+                "Operation failed",
+                operation=operation,
+                duration_ms=duration_ms,
+                success=success,
+                **(metadata or {})
+            )
 
     def log_server_response_time(
         self,
@@ -157,3 +168,36 @@ class PerformanceLogger:
 # Global logger instances
 logger = configure_logging()
 performance_logger = PerformanceLogger(logger)
+
+
+def measured_tool(
+    tool_name: str, *log_params: str
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Time a tool and log its execution, logging log_params on failure."""
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            start_time = perf_counter()
+
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                duration_ms = (perf_counter() - start_time) * 1000
+                performance_logger.log_tool_execution(tool_name, duration_ms, False)
+                bound = signature.bind_partial(*args, **kwargs)
+                bound.apply_defaults()
+                context = {name: bound.arguments.get(name) for name in log_params}
+                logger.error(f"Error in {tool_name}", **context, error=str(e))
+                raise
+
+            duration_ms = (perf_counter() - start_time) * 1000
+            performance_logger.log_tool_execution(tool_name, duration_ms, True)
+
+            return result
+
+        return wrapper
+
+    return decorator
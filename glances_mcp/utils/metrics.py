@@ -1,11 +1,29 @@
 """Metrics calculation utilities for Glances MCP server."""
 
+from bisect import bisect_left
 from datetime import datetime, timedelta
+import math
+from operator import attrgetter
 import statistics
 from typing import Any
 
 from glances_mcp.config.models import MetricPoint, PerformanceBaseline
 
+# Component weights used by calculate_composite_score when none are given; read-only
+_DEFAULT_SCORE_WEIGHTS = {
+    "cpu": 0.25,
+    "memory": 0.25,
+    "disk": 0.25,
+    "network": 0.15,
+    "load": 0.10
+}
+
+# Two-sided z-scores for the usual confidence levels; others are derived on demand
+_Z_SCORES = {0.90: 1.645, 0.95: 1.96, 0.99: 2.58}
+
+# Indexed by how many deviation bounds a z-score exceeds
+_BASELINE_STATUSES = ("normal", "warning", "critical")
+
 
 class MetricsCalculator:
     """Utility class for metrics calculations."""
@@ -44,17 +62,9 @@ class MetricsCalculator:
             return 0.0
 
         try:
-            total_score = 0
-            count = 0
-
-            for disk in disk_data:
-                percent = disk.get("percent", 0)
-                # Score based on available space
-                disk_score = max(0, 100 - percent)
-                total_score += disk_score
-                count += 1
-
-            return total_score / count if count > 0 else 0.0
+            # Score based on available space
+            total_score: float = sum(max(0, 100 - disk.get("percent", 0)) for disk in disk_data)
+            return total_score / len(disk_data)
         except Exception:
             return 0.0
 
@@ -69,15 +79,12 @@ class MetricsCalculator:
             total_packets = 0
 
             for interface in network_data:
-                rx_errors = interface.get("rx_errors", 0)
-                tx_errors = interface.get("tx_errors", 0)
-                rx_packets = interface.get("rx_packets", 0)
-                tx_packets = interface.get("tx_packets", 0)
+                get = interface.get
+                total_errors += get("rx_errors", 0) + get("tx_errors", 0)
+                total_packets += get("rx_packets", 0) + get("tx_packets", 0)
 
-                total_errors += rx_errors + tx_errors
-                total_packets += rx_packets + tx_packets
-
-            if total_packets == 0:
+            # Most refreshes see no errors at all, which always scores full marks
+            if total_errors == 0 or total_packets == 0:
                 return 100.0
 
             error_rate = (total_errors / total_packets) * 100
@@ -93,15 +100,8 @@ class MetricsCalculator:
             load_5min = load_data.get("min5", 0)
             load_15min = load_data.get("min15", 0)
 
-            # Normalize by CPU count
-            normalized_loads = [
-                load_1min / cpu_count,
-                load_5min / cpu_count,
-                load_15min / cpu_count
-            ]
-
-            # Average normalized load
-            avg_load = sum(normalized_loads) / len(normalized_loads)
+            # Average load normalized by CPU count, folded into a single division
+            avg_load = (load_1min + load_5min + load_15min) / (3 * cpu_count)
 
             # Score based on load (1.0 is 100% CPU utilization)
             if avg_load <= 0.7:
@@ -120,19 +120,14 @@ class MetricsCalculator:
             return 0.0
 
         if weights is None:
-            weights = {
-                "cpu": 0.25,
-                "memory": 0.25,
-                "disk": 0.25,
-                "network": 0.15,
-                "load": 0.10
-            }
+            weights = _DEFAULT_SCORE_WEIGHTS
 
         total_score = 0.0
         total_weight = 0.0
 
+        get_weight = weights.get
         for metric, score in scores.items():
-            weight = weights.get(metric, 0.0)
+            weight = get_weight(metric, 0.0)
             total_score += score * weight
             total_weight += weight
 
@@ -148,18 +143,20 @@ class MetricsCalculator:
             return []
 
         try:
-            mean = statistics.mean(values)
-            stdev = statistics.stdev(values)
-
-            anomalies = []
-            for i, value in enumerate(values):
-                z_score = abs(value - mean) / stdev if stdev > 0 else 0
-
-                if z_score > threshold_std:
-                    anomaly_type = "high" if value > mean else "low"
-                    anomalies.append((i, value, anomaly_type))
-
-            return anomalies
+            # Float sums are far cheaper than statistics.mean/stdev's exact fractions
+            count = len(values)
+            mean = math.fsum(values) / count
+            stdev = math.sqrt(math.fsum((value - mean) ** 2 for value in values) / (count - 1))
+            if stdev == 0:
+                return []
+
+            # Compare deviations against a fixed cutoff instead of dividing out a z-score per value
+            max_deviation = threshold_std * stdev
+            return [
+                (i, value, "high" if value > mean else "low")
+                for i, value in enumerate(values)
+                if abs(value - mean) > max_deviation
+            ]
         except Exception:
             return []
 
@@ -178,29 +175,36 @@ class MetricsCalculator:
             }
 
         try:
-            # Sort by timestamp
-            sorted_points = sorted(points, key=lambda p: p.timestamp)
-
-            # Filter to window
+            # Filter to window, then sort by timestamp; sorting is stable, so this
+            # orders the same as sorting first but only over the points kept
+            by_timestamp = attrgetter("timestamp")
             cutoff_time = datetime.now() - timedelta(minutes=window_minutes)
-            recent_points = [p for p in sorted_points if p.timestamp >= cutoff_time]
+            recent_points = [p for p in points if p.timestamp >= cutoff_time]
 
             if len(recent_points) < 2:
-                recent_points = sorted_points[-2:]
-
-            # Calculate linear regression
-            x_values = [(p.timestamp - recent_points[0].timestamp).total_seconds()
-                       for p in recent_points]
-            y_values = [p.value for p in recent_points]
-
-            n = len(x_values)
-            sum_x = sum(x_values)
-            sum_y = sum(y_values)
-            sum_xy = sum(x * y for x, y in zip(x_values, y_values, strict=False))
-            sum_x2 = sum(x * x for x in x_values)
+                recent_points = sorted(points, key=by_timestamp)[-2:]
+            else:
+                recent_points.sort(key=by_timestamp)
+
+            # Calculate linear regression and correlation from one pass of running sums
+            start_time = recent_points[0].timestamp
+            n = len(recent_points)
+            sum_x = sum_y = sum_x2 = sum_y2 = sum_xy = 0.0
+            for p in recent_points:
+                x = (p.timestamp - start_time).total_seconds()
+                y = p.value
+                sum_x += x
+                sum_y += y
+                sum_x2 += x * x
+                sum_y2 += y * y
+                sum_xy += x * y
+
+            covariance = n * sum_xy - sum_x * sum_y
+            x_variance = n * sum_x2 - sum_x * sum_x
+            y_variance = n * sum_y2 - sum_y * sum_y
 
             # Calculate slope
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x) if (n * sum_x2 - sum_x * sum_x) != 0 else 0
+            slope = covariance / x_variance if x_variance != 0 else 0
 
             # Determine direction
             if abs(slope) < 0.01:
@@ -210,12 +214,10 @@ class MetricsCalculator:
             else:
                 direction = "decreasing"
 
-            # Calculate confidence (correlation coefficient)
-            try:
-                correlation = statistics.correlation(x_values, y_values)
-                confidence = abs(correlation)
-            except (ValueError, ZeroDivisionError):
-                confidence = 0.0
+            # Calculate confidence (correlation coefficient); rounding can push a
+            # near-zero variance negative, so only positive products count
+            variance_product = x_variance * y_variance
+            confidence = abs(covariance) / math.sqrt(variance_product) if variance_product > 0 else 0.0
 
             # Recent change percentage
             if len(recent_points) >= 2:
@@ -249,16 +251,19 @@ class MetricsCalculator:
             raise ValueError("No data points provided for baseline calculation")
 
         values = [p.value for p in points]
+        count = len(values)
 
-        # Calculate statistics
-        mean_value = statistics.mean(values)
-        std_dev = statistics.stdev(values) if len(values) > 1 else 0.0
+        # Calculate statistics with float sums rather than statistics' exact fractions
+        mean_value = math.fsum(values) / count
+        std_dev = math.sqrt(math.fsum((v - mean_value) ** 2 for v in values) / (count - 1)) if count > 1 else 0.0
 
         # Calculate confidence interval
-        if len(values) > 1:
+        if count > 1:
             # Using z-score for normal distribution approximation
-            z_score = 1.96 if confidence_level == 0.95 else 2.58  # 99% confidence
-            margin = z_score * (std_dev / (len(values) ** 0.5))
+            z_score = _Z_SCORES.get(confidence_level)
+            if z_score is None:
+                z_score = statistics.NormalDist().inv_cdf((1 + confidence_level) / 2)
+            margin = z_score * (std_dev / math.sqrt(count))
             confidence_interval = (mean_value - margin, mean_value + margin)
         else:
             confidence_interval = (mean_value, mean_value)
@@ -292,13 +297,9 @@ class MetricsCalculator:
             deviation = current_value - baseline.baseline_value
             z_score = deviation / baseline.std_deviation
 
-        # Determine status
-        if abs(z_score) <= 1.0:
-            status = "normal"
-        elif abs(z_score) <= threshold_std:
-            status = "warning"
-        else:
-            status = "critical"
+        # Determine status; bisect_left keeps each boundary inclusive of the lower status,
+        # and max() keeps the bounds ordered when threshold_std is below 1
+        status = _BASELINE_STATUSES[bisect_left((1.0, max(1.0, threshold_std)), abs(z_score))]
 
         # Calculate percentage change
         if baseline.baseline_value != 0: